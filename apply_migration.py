@@ -1,34 +1,52 @@
 #!/usr/bin/env python3
 """
-Apply database migration for full text content support.
+Print the database migrations to apply in the Supabase SQL editor.
 """
 
 import os
+import sys
+
+MIGRATIONS_DIR = "database/migrations"
 
 def apply_migration():
-    """Apply the full text migration."""
-    
-    # Read migration SQL
-    migration_path = "database/migrations/001_add_full_text_column.sql"
+    """Print every migration, in order, for manual application."""
     
-    if not os.path.exists(migration_path):
-        print(f"Migration file not found: {migration_path}")
+    if not os.path.isdir(MIGRATIONS_DIR):
+        print(f"Migrations directory not found: {MIGRATIONS_DIR}")
         return False
     
-    with open(migration_path, 'r') as f:
-        migration_sql = f.read()
+    # Files are numbered, so name order is the order to apply them in
+    migration_files = sorted(
+        name for name in os.listdir(MIGRATIONS_DIR) if name.endswith(".sql")
+    )
+    if not migration_files:
+        print(f"No migrations found in {MIGRATIONS_DIR}")
+        return False
     
-    print("Database Migration: Add full_text columns to articles table")
-    print("=" * 60)
-    print(migration_sql)
-    print("=" * 60)
+    for name in migration_files:
+        migration_path = os.path.join(MIGRATIONS_DIR, name)
+        
+        # The SQL is only echoed, so copy the raw bytes without text decoding
+        fd = os.open(migration_path, os.O_RDONLY)
+        try:
+            migration_sql = os.read(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+        
+        print(f"Database Migration: {name}")
+        print("=" * 60)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(migration_sql + b"\n")
+        sys.stdout.buffer.flush()
+        print("=" * 60)
     
     print("\n⚠️  MANUAL ACTION REQUIRED:")
-    print("Please copy the above SQL and run it in your Supabase SQL Editor:")
+    print("Please copy the above SQL and run it in your Supabase SQL Editor.")
+    print("Already applied migrations can be skipped; apply the rest in order:")
     print("1. Go to https://supabase.com/dashboard/project/[your-project]/sql")
     print("2. Paste the SQL above")
     print("3. Click 'Run'")
-    print("\nAfter running the migration, you can test the content fetching with:")
+    print("\nAfter running the migrations, you can test the content fetching with:")
     print("python run.py content status --hours 24")
     
     return True
@@ -0,0 +1,18 @@
+-- Migration: Add article_status_counts() aggregate
+-- Date: 2025-10-01
+-- Purpose: Let `content status` fetch the fetch_status breakdown as one row
+--          per status instead of downloading every article's status
+
+-- Articles without a status are reported as 'pending', matching the column default
+CREATE OR REPLACE FUNCTION article_status_counts()
+RETURNS TABLE (fetch_status VARCHAR(20), count BIGINT)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT COALESCE(a.fetch_status, 'pending')::VARCHAR(20) AS fetch_status,
+           COUNT(*) AS count
+    FROM articles a
+    GROUP BY 1;
+$$;
+
+COMMENT ON FUNCTION article_status_counts() IS 'Number of articles per full text fetch status';
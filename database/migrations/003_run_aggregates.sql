@@ -0,0 +1,20 @@
+-- Migration: Add run_aggregates() aggregate
+-- Date: 2025-10-02
+-- Purpose: Let `news summary` fetch run totals as a single row instead of
+--          downloading one row per run (and hitting PostgREST's max-rows cap)
+
+-- Runs without an article count add nothing to the total and are left out
+-- of the average, matching the direct PostgreSQL query in MetricsService
+CREATE OR REPLACE FUNCTION run_aggregates(since TIMESTAMP WITH TIME ZONE)
+RETURNS TABLE (total_runs BIGINT, total_articles BIGINT, avg_articles DOUBLE PRECISION)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT COUNT(*) AS total_runs,
+           COALESCE(SUM(r.articles_after_dedup), 0)::BIGINT AS total_articles,
+           COALESCE(AVG(r.articles_after_dedup), 0)::DOUBLE PRECISION AS avg_articles
+    FROM run_metrics r
+    WHERE r.created_at >= since;
+$$;
+
+COMMENT ON FUNCTION run_aggregates(TIMESTAMP WITH TIME ZONE) IS 'Run count and article totals since a point in time';
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+argparse-backed parsing for the News Aggregator CLI.
+
+Kept separate from ``cli_router`` so that invocations the router can parse
+on its own never import argparse. Everything here is loaded on demand: for
+help output, validation errors and any argv the fast path does not handle.
+"""
+
+import argparse
+import logging
+import os
+import sys
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from cli_router import (
+    _COMMAND_SPECS, _LEAF_SPECS, _PRECOMPUTED_EPILOG, _configure_logging, _dispatch
+)
+
+# The CLI is English-only; route argparse's message lookups around gettext's
+# per-string catalog search
+argparse._ = lambda message: message
+argparse.ngettext = lambda singular, plural, n: singular if n == 1 else plural
+
+logger = logging.getLogger(__name__)
+
+
+class _ExamplesHelpParser(argparse.ArgumentParser):
+    """Top-level parser whose help ends with the precomputed examples."""
+    
+    def format_help(self) -> str:
+        return ''.join([super().format_help(), _PRECOMPUTED_EPILOG])
+
+
+class _FrozenChoicesAction(argparse.Action):
+    """
+    Store action that validates ``choices`` with a frozenset lookup.
+    
+    argparse checks each value with a linear scan over ``choices``; this
+    action takes over validation so every value is an O(1) set lookup,
+    while help and error messages keep the declared choice order.
+    """
+    
+    def __init__(self, option_strings, dest, choices, metavar=None, **kwargs):
+        if metavar is None:
+            metavar = '{' + ','.join(choices) + '}'
+        # choices is deliberately not passed on, so argparse skips its own scan
+        super().__init__(option_strings, dest, metavar=metavar, **kwargs)
+        self._choice_names = tuple(choices)
+        self._choice_set = frozenset(choices)
+    
+    def __call__(self, parser, namespace, values, option_string=None):
+        for value in values if isinstance(values, list) else (values,):
+            if value not in self._choice_set:
+                choices = ', '.join(map(repr, self._choice_names))
+                raise argparse.ArgumentError(self, f"invalid choice: {value!r} (choose from {choices})")
+        setattr(namespace, self.dest, values)
+
+
+def _add_leaf_arguments(parser: argparse.ArgumentParser, command: str, subcommand: str) -> None:
+    """Add the arguments of one ``command subcommand`` leaf to a parser."""
+    for flags, kwargs in _LEAF_SPECS[(command, subcommand)][1]:
+        if 'choices' in kwargs:
+            kwargs = dict(kwargs, action=_FrozenChoicesAction)
+        parser.add_argument(*flags, **kwargs)
+
+
+class FastDispatcher:
+    """
+    Parse ``command subcommand [options]`` by building only the leaf parser.
+    
+    The CLI grammar is a fixed two levels deep, so when argv starts with a
+    known (command, subcommand) pair there is no need to construct the full
+    subparser tree. Anything else (help, typos, options before the
+    subcommand) is left to the full parser.
+    """
+    
+    def parse(self, argv: List[str]) -> Optional[argparse.Namespace]:
+        """
+        Parse argv for a known leaf.
+        
+        Args:
+            argv: Command line arguments (without the program name)
+            
+        Returns:
+            Parsed namespace, or None if argv does not start with a known leaf
+        """
+        if len(argv) < 2 or (argv[0], argv[1]) not in _LEAF_SPECS:
+            return None
+        
+        command, subcommand = argv[0], argv[1]
+        parser = self._build_leaf_parser(command, subcommand)
+        parsed_args = parser.parse_args(argv[2:])
+        parsed_args.command = command
+        parsed_args.subcommand = subcommand
+        return parsed_args
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _build_leaf_parser(command: str, subcommand: str) -> argparse.ArgumentParser:
+        """
+        Build a standalone parser for a single leaf.
+        
+        Parsers are reusable, so each leaf is built at most once per process.
+        They are not persisted across processes: argparse registers a local
+        ``identity`` function that cannot be pickled, and unpickling from a
+        user-writable cache directory would execute arbitrary code.
+        """
+        prog = f"{os.path.basename(sys.argv[0])} {command} {subcommand}"
+        parser = argparse.ArgumentParser(prog=prog)
+        _add_leaf_arguments(parser, command, subcommand)
+        return parser
+
+
+class CLIRouter:
+    """
+    Modern CLI router for news aggregation commands.
+    
+    Command structure:
+    - python run.py news fetch --hours 6 --verbose  
+    - python run.py news analyze --hours 6 --slack
+    - python run.py state stats
+    - python run.py data cleanup --days 30
+    """
+    
+    def __init__(self):
+        """Initialize CLI router."""
+        # Built per invocation in route_command, once the argv is known
+        self.parser: Optional[argparse.ArgumentParser] = None
+        # Command name -> its fully built subparser, for printing help
+        self._subparsers: Dict[str, argparse.ArgumentParser] = {}
+    
+    @classmethod
+    def _sniff_subcommand(cls, argv: List[str]) -> Optional[str]:
+        """
+        Find the command being invoked without running argparse.
+        
+        Args:
+            argv: Command line arguments (without the program name)
+            
+        Returns:
+            The command name, or None if no known command is present
+        """
+        for token in argv:
+            if token.startswith('-'):
+                continue
+            return token if token in _COMMAND_SPECS else None
+        return None
+    
+    def _create_parser(self, argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+        """
+        Create the main argument parser.
+        
+        Only the subparser tree for the invoked command is fully built; the
+        other commands get argument-less stubs so they still appear in help.
+        With no recognizable command (e.g. bare ``--help``) all trees are built.
+        """
+        parser = _ExamplesHelpParser(
+            description="Israeli News Aggregator with Hebrew Analysis"
+        )
+        
+        # Add subparsers for new command structure; command parsers use the
+        # stock class so their help does not repeat the examples
+        subparsers = parser.add_subparsers(
+            dest='command',
+            help='Available commands',
+            metavar='{command}',
+            parser_class=argparse.ArgumentParser
+        )
+        
+        # Create subparsers for each command
+        invoked = self._sniff_subcommand(argv) if argv is not None else None
+        for name, (help_text, _) in _COMMAND_SPECS.items():
+            if invoked is None or name == invoked:
+                self._add_parser_from_spec(subparsers, name)
+            else:
+                subparsers.add_parser(name, help=help_text, add_help=False)
+        
+        return parser
+    
+    def _add_parser_from_spec(self, subparsers, command: str) -> None:
+        """Add a command parser and its subcommands from the spec tables."""
+        help_text, subcommands_help = _COMMAND_SPECS[command]
+        leaves = [(subcommand, leaf_help) for (leaf_command, subcommand), (leaf_help, _)
+                  in _LEAF_SPECS.items() if leaf_command == command]
+        
+        command_parser = subparsers.add_parser(command, help=help_text)
+        self._subparsers[command] = command_parser
+        
+        command_subparsers = command_parser.add_subparsers(
+            dest='subcommand',
+            help=subcommands_help,
+            metavar='{' + ','.join(subcommand for subcommand, _ in leaves) + '}'
+        )
+        
+        for subcommand, leaf_help in leaves:
+            leaf_parser = command_subparsers.add_parser(subcommand, help=leaf_help)
+            _add_leaf_arguments(leaf_parser, command, subcommand)
+    
+    def route_command(self, args: Optional[List[str]] = None) -> int:
+        """
+        Route command to appropriate handler.
+        
+        Args:
+            args: Command line arguments (uses sys.argv if None)
+            
+        Returns:
+            Exit code
+        """
+        try:
+            if args is None:
+                args = sys.argv[1:]
+            
+            # Well-formed "command subcommand ..." invocations only need
+            # the one leaf parser; fall back to the full tree otherwise
+            parsed_args = FastDispatcher().parse(args)
+            if parsed_args is None:
+                self.parser = self._create_parser(args)
+                parsed_args = self.parser.parse_args(args)
+            
+            # Handle command structure
+            if not parsed_args.command:
+                self.parser.print_help()
+                return 1
+                
+            return self._handle_command(parsed_args)
+            
+        except SystemExit as e:
+            # argparse calls sys.exit() on error or help
+            return e.code if e.code is not None else 0
+        except Exception as e:
+            logger.error(f"CLI routing error: {e}", exc_info=True)
+            return 1
+    
+    
+    def _handle_command(self, args: argparse.Namespace) -> int:
+        """Handle command structure."""
+        command_name = args.command
+        if command_name in _COMMAND_SPECS and not getattr(args, 'subcommand', None):
+            _configure_logging()
+            logger.error(f"No subcommand specified for '{command_name}'")
+            self._subparsers[command_name].print_help()
+            return 1
+        
+        return _dispatch(args)
@@ -5,242 +5,30 @@ Smart CLI Router for the News Aggregator.
 Modern modular command architecture for news aggregation.
 """
 
-import argparse
 import logging
+import os
+import shutil
 import sys
-from typing import Optional, List
+from functools import lru_cache, partial
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-# Load environment variables first
-import core.env_loader  # Auto-loads .env file
-
-from commands import get_command, list_commands, COMMANDS
+from core.exceptions import CLIError
 
 logger = logging.getLogger(__name__)
 
+# Built once; logging is only configured when a command actually runs
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
-class CLIRouter:
-    """
-    Modern CLI router for news aggregation commands.
-    
-    Command structure:
-    - python run.py news fetch --hours 6 --verbose  
-    - python run.py news analyze --hours 6 --slack
-    - python run.py state stats
-    - python run.py data cleanup --days 30
-    """
-    
-    def __init__(self):
-        """Initialize CLI router."""
-        self.parser = self._create_parser()
-    
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """Create the main argument parser."""
-        parser = argparse.ArgumentParser(
-            description="Israeli News Aggregator with Hebrew Analysis",
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog=self._get_examples_text()
-        )
-        
-        # Add subparsers for new command structure
-        subparsers = parser.add_subparsers(
-            dest='command',
-            help='Available commands',
-            metavar='{command}'
-        )
-        
-        # Create subparsers for each command
-        self._add_news_parser(subparsers)
-        self._add_content_parser(subparsers)
-        self._add_state_parser(subparsers)
-        self._add_data_parser(subparsers)
-        self._add_integrations_parser(subparsers)
-        self._add_health_parser(subparsers)
-        
-        
-        return parser
-    
-    def _add_news_parser(self, subparsers):
-        """Add news command parser."""
-        news_parser = subparsers.add_parser(
-            'news',
-            help='News fetching, analysis, and summary operations'
-        )
-        
-        news_subparsers = news_parser.add_subparsers(
-            dest='subcommand',
-            help='News operations',
-            metavar='{fetch,analyze,summary}'
-        )
-        
-        # Fetch subcommand
-        fetch_parser = news_subparsers.add_parser('fetch', help='Fetch and analyze news articles from RSS feeds')
-        fetch_parser.add_argument('--hours', type=int, default=1, help='Hours to look back (default: 1 for GitHub Actions)')
-        fetch_parser.add_argument('--sources', nargs='+', choices=['ynet', 'walla', 'globes', 'haaretz', 'aljazeera', 'bbc_arabic', 'all'], default=['all'], help='News sources to fetch from (default: all)')
-        fetch_parser.add_argument('--similarity', type=float, default=0.8, help='Similarity threshold for deduplication (default: 0.8)')
-        fetch_parser.add_argument('--no-dedupe', action='store_true', help='Skip deduplication')
-        fetch_parser.add_argument('--no-analysis', action='store_true', help='Skip Hebrew AI analysis (analysis is now default)')
-        fetch_parser.add_argument('--updates-only', action='store_true', help='Show only new/updated content')
-        fetch_parser.add_argument('--no-slack', action='store_true', help='Skip Slack notifications (Slack is default for GitHub Actions)')
-        fetch_parser.add_argument('--async', dest='async_fetch', action='store_true', help='Use async RSS fetching for better performance')
-        fetch_parser.add_argument('--verbose', action='store_true', help='Verbose output')
-        
-        # Analyze subcommand
-        analyze_parser = news_subparsers.add_parser('analyze', help='Analyze articles with Hebrew AI analysis')
-        analyze_parser.add_argument('--hours', type=int, default=1, help='Hours to look back (default: 1 for GitHub Actions)')
-        analyze_parser.add_argument('--sources', nargs='+', choices=['ynet', 'walla', 'globes', 'haaretz', 'aljazeera', 'bbc_arabic', 'all'], default=['all'], help='News sources to fetch from (default: all)')
-        analyze_parser.add_argument('--similarity', type=float, default=0.8, help='Similarity threshold for deduplication (default: 0.8)')
-        analyze_parser.add_argument('--no-dedupe', action='store_true', help='Skip deduplication')
-        analyze_parser.add_argument('--async', dest='async_fetch', action='store_true', help='Use async RSS fetching for better performance')
-        analyze_parser.add_argument('--updates-only', action='store_true', help='Show only new/updated content')
-        analyze_parser.add_argument('--no-slack', action='store_true', help='Skip Slack notifications (Slack is default for GitHub Actions)')
-        analyze_parser.add_argument('--state-file', default=None, help='[DEPRECATED] State now stored in database')
-        analyze_parser.add_argument('--verbose', action='store_true', help='Verbose output')
-        
-        # Summary subcommand
-        summary_parser = news_subparsers.add_parser('summary', help='Show summary of recent news activity')
-        summary_parser.add_argument('--days', type=int, default=3, help='Days to include in summary (default: 3)')
-    
-    def _add_content_parser(self, subparsers):
-        """Add content command parser."""
-        content_parser = subparsers.add_parser(
-            'content',
-            help='Full article content fetching and management'
-        )
-        
-        content_subparsers = content_parser.add_subparsers(
-            dest='subcommand',
-            help='Content operations',
-            metavar='{fetch,status,reset}'
-        )
-        
-        # Fetch subcommand
-        fetch_parser = content_subparsers.add_parser('fetch', help='Fetch full content for articles')
-        fetch_parser.add_argument('--max-articles', type=int, default=15, help='Maximum articles to fetch (default: 15)')
-        fetch_parser.add_argument('--reset-failed', action='store_true', help='Reset failed articles to pending')
-        fetch_parser.add_argument('--reset-hours', type=int, default=24, help='Reset failed from last N hours (default: 24)')
-        
-        # Status subcommand
-        status_parser = content_subparsers.add_parser('status', help='Show content fetching status')
-        status_parser.add_argument('--hours', type=int, default=24, help='Hours to look back (default: 24)')
-        
-        # Reset subcommand  
-        reset_parser = content_subparsers.add_parser('reset', help='Reset content fetch status')
-        reset_parser.add_argument('--hours', type=int, default=24, help='Reset articles from last N hours (default: 24)')
-        reset_parser.add_argument('--force', action='store_true', help='Skip confirmation')
-    
-    def _add_state_parser(self, subparsers):
-        """Add state command parser."""
-        state_parser = subparsers.add_parser(
-            'state',
-            help='State management operations'
-        )
-        
-        state_subparsers = state_parser.add_subparsers(
-            dest='subcommand',
-            help='State operations',
-            metavar='{stats,cleanup,reset}'
-        )
-        
-        # Stats subcommand
-        stats_parser = state_subparsers.add_parser('stats', help='Show state statistics')
-        stats_parser.add_argument('--state-file', default=None, help='[DEPRECATED] State now stored in database')
-        
-        # Cleanup subcommand
-        cleanup_parser = state_subparsers.add_parser('cleanup', help='Clean up old events')
-        cleanup_parser.add_argument('--days', type=int, default=30, help='Remove events older than N days (default: 30)')
-        cleanup_parser.add_argument('--state-file', default=None, help='[DEPRECATED] State now stored in database')
-        
-        # Reset subcommand
-        reset_parser = state_subparsers.add_parser('reset', help='Reset state (clear all known events)')
-        reset_parser.add_argument('--force', action='store_true', help='Skip confirmation prompt')
-        reset_parser.add_argument('--state-file', default=None, help='[DEPRECATED] State now stored in database')
-    
-    def _add_data_parser(self, subparsers):
-        """Add data command parser."""
-        data_parser = subparsers.add_parser(
-            'data',
-            help='Data management operations'
-        )
-        
-        data_subparsers = data_parser.add_subparsers(
-            dest='subcommand',
-            help='Data operations',
-            metavar='{stats,cleanup,export,recent}'
-        )
-        
-        # Stats subcommand
-        stats_parser = data_subparsers.add_parser('stats', help='Show data storage statistics')
-        
-        # Cleanup subcommand
-        cleanup_parser = data_subparsers.add_parser('cleanup', help='Clean up old data files')
-        cleanup_parser.add_argument('--days', type=int, default=30, help='Remove files older than N days (default: 30)')
-        
-        # Export subcommand
-        export_parser = data_subparsers.add_parser('export', help='Export data to different formats')
-        export_parser.add_argument('--format', choices=['csv', 'json'], default='json', help='Export format')
-        export_parser.add_argument('--days', type=int, default=7, help='Days to include (default: 7)')
-        
-        # Recent subcommand
-        recent_parser = data_subparsers.add_parser('recent', help='Show recent data activity')
-        recent_parser.add_argument('--days', type=int, default=3, help='Days to show (default: 3)')
-        recent_parser.add_argument('--type', choices=['articles', 'analyses'], default='articles', help='Data type to show')
-        recent_parser.add_argument('--verbose', action='store_true', help='Show detailed information')
-    
-    def _add_integrations_parser(self, subparsers):
-        """Add integrations command parser."""
-        integrations_parser = subparsers.add_parser(
-            'integrations',
-            help='External integration management'
-        )
-        
-        integrations_subparsers = integrations_parser.add_subparsers(
-            dest='subcommand',
-            help='Integration operations',
-            metavar='{test,slack,openai,status}'
-        )
-        
-        # Test subcommand
-        test_parser = integrations_subparsers.add_parser('test', help='Test all integrations')
-        
-        # Slack subcommand
-        slack_parser = integrations_subparsers.add_parser('slack', help='Slack integration management')
-        slack_parser.add_argument('--action', choices=['test', 'send'], default='test', help='Action to perform')
-        slack_parser.add_argument('--message', help='Message to send (for send action)')
-        
-        # OpenAI subcommand
-        openai_parser = integrations_subparsers.add_parser('openai', help='OpenAI integration management')
-        openai_parser.add_argument('--action', choices=['test', 'analyze'], default='test', help='Action to perform')
-        openai_parser.add_argument('--text', help='Text to analyze (for analyze action)')
-        
-        # Status subcommand
-        status_parser = integrations_subparsers.add_parser('status', help='Show integration status')
-    
-    def _add_health_parser(self, subparsers):
-        """Add health command parser."""
-        health_parser = subparsers.add_parser(
-            'health',
-            help='System health monitoring and diagnostics'
-        )
-        
-        health_subparsers = health_parser.add_subparsers(
-            dest='subcommand',
-            help='Health operations',
-            metavar='{check,database,integrations}'
-        )
-        
-        # General health check
-        check_parser = health_subparsers.add_parser('check', help='Run comprehensive health check')
-        
-        # Database health check
-        database_parser = health_subparsers.add_parser('database', help='Check database health')
-        
-        # Integrations health check
-        integrations_parser = health_subparsers.add_parser('integrations', help='Check integration health')
-        integrations_parser.add_argument('--test', action='store_true', help='Test actual connections')
-    
-    def _get_examples_text(self) -> str:
-        """Get examples text for help."""
-        return """
+# Rendered top-level help is cached on disk, keyed by the CLI sources' mtime
+_HELP_CACHE_FILE = Path('newser') / 'help.txt'
+_HELP_ARGS = ([], ['-h'], ['--help'])
+
+
+def _get_examples_text() -> str:
+    """Get examples text for help."""
+    return """
 Examples:
   # Default GitHub Actions mode (1 hour, Slack enabled, AI analysis)
   python run.py news fetch
@@ -258,61 +46,313 @@ Examples:
   python run.py health check
   
 """
+
+
+# The examples are static, so they are appended verbatim to the top-level
+# help rather than run through argparse's text formatting on every render
+_PRECOMPUTED_EPILOG = _get_examples_text()
+
+
+_SOURCE_CHOICES = ('ynet', 'walla', 'globes', 'haaretz', 'aljazeera', 'bbc_arabic', 'all')
+
+# Command name -> (help text, help text for its subcommand list)
+_COMMAND_SPECS: Dict[str, Tuple[str, str]] = {
+    'news': ('News fetching, analysis, and summary operations', 'News operations'),
+    'content': ('Full article content fetching and management', 'Content operations'),
+    'state': ('State management operations', 'State operations'),
+    'data': ('Data management operations', 'Data operations'),
+    'integrations': ('External integration management', 'Integration operations'),
+    'health': ('System health monitoring and diagnostics', 'Health operations'),
+}
+
+# (command, subcommand) -> (help text, [(flags, add_argument kwargs), ...])
+# Shared by the fast path, the full parser tree and FastDispatcher's
+# single-leaf parsers.
+_LEAF_SPECS: Dict[Tuple[str, str], Tuple[str, List[Tuple[Tuple[str, ...], Dict[str, Any]]]]] = {
+    ('news', 'fetch'): ('Fetch and analyze news articles from RSS feeds', [
+        (('--hours',), dict(type=int, default=1, help='Hours to look back (default: 1 for GitHub Actions)')),
+        (('--sources',), dict(nargs='+', choices=_SOURCE_CHOICES, default=['all'], help='News sources to fetch from (default: all)')),
+        (('--similarity',), dict(type=float, default=0.8, help='Similarity threshold for deduplication (default: 0.8)')),
+        (('--no-dedupe',), dict(action='store_true', help='Skip deduplication')),
+        (('--no-analysis',), dict(action='store_true', help='Skip Hebrew AI analysis (analysis is now default)')),
+        (('--updates-only',), dict(action='store_true', help='Show only new/updated content')),
+        (('--no-slack',), dict(action='store_true', help='Skip Slack notifications (Slack is default for GitHub Actions)')),
+        (('--async',), dict(dest='async_fetch', action='store_true', help='Use async RSS fetching for better performance')),
+        (('--force',), dict(action='store_true', help='Re-run analysis even if the same articles were analyzed in the last hour')),
+        (('--verbose',), dict(action='store_true', help='Verbose output')),
+    ]),
+    ('news', 'analyze'): ('Analyze articles with Hebrew AI analysis', [
+        (('--hours',), dict(type=int, default=1, help='Hours to look back (default: 1 for GitHub Actions)')),
+        (('--sources',), dict(nargs='+', choices=_SOURCE_CHOICES, default=['all'], help='News sources to fetch from (default: all)')),
+        (('--similarity',), dict(type=float, default=0.8, help='Similarity threshold for deduplication (default: 0.8)')),
+        (('--no-dedupe',), dict(action='store_true', help='Skip deduplication')),
+        (('--async',), dict(dest='async_fetch', action='store_true', help='Use async RSS fetching for better performance')),
+        (('--updates-only',), dict(action='store_true', help='Show only new/updated content')),
+        (('--no-slack',), dict(action='store_true', help='Skip Slack notifications (Slack is default for GitHub Actions)')),
+        (('--state-file',), dict(default=None, help='[DEPRECATED] State now stored in database')),
+        (('--force',), dict(action='store_true', help='Re-run analysis even if the same articles were analyzed in the last hour')),
+        (('--verbose',), dict(action='store_true', help='Verbose output')),
+    ]),
+    ('news', 'summary'): ('Show summary of recent news activity', [
+        (('--days',), dict(type=int, default=3, help='Days to include in summary (default: 3)')),
+    ]),
+    ('content', 'fetch'): ('Fetch full content for articles', [
+        (('--max-articles',), dict(type=int, default=15, help='Maximum articles to fetch (default: 15)')),
+        (('--reset-failed',), dict(action='store_true', help='Reset failed articles to pending')),
+        (('--reset-hours',), dict(type=int, default=24, help='Reset failed from last N hours (default: 24)')),
+    ]),
+    ('content', 'status'): ('Show content fetching status', [
+        (('--hours',), dict(type=int, default=24, help='Hours to look back (default: 24)')),
+    ]),
+    ('content', 'reset'): ('Reset content fetch status', [
+        (('--hours',), dict(type=int, default=24, help='Reset articles from last N hours (default: 24)')),
+        (('--force',), dict(action='store_true', help='Skip confirmation')),
+    ]),
+    ('state', 'stats'): ('Show state statistics', [
+        (('--state-file',), dict(default=None, help='[DEPRECATED] State now stored in database')),
+    ]),
+    ('state', 'cleanup'): ('Clean up old events', [
+        (('--days',), dict(type=int, default=30, help='Remove events older than N days (default: 30)')),
+        (('--state-file',), dict(default=None, help='[DEPRECATED] State now stored in database')),
+    ]),
+    ('state', 'reset'): ('Reset state (clear all known events)', [
+        (('--force',), dict(action='store_true', help='Skip confirmation prompt')),
+        (('--state-file',), dict(default=None, help='[DEPRECATED] State now stored in database')),
+    ]),
+    ('data', 'stats'): ('Show data storage statistics', []),
+    ('data', 'cleanup'): ('Clean up old data files', [
+        (('--days',), dict(type=int, default=30, help='Remove files older than N days (default: 30)')),
+    ]),
+    ('data', 'export'): ('Export data to different formats', [
+        (('--format',), dict(choices=('csv', 'json'), default='json', help='Export format')),
+        (('--days',), dict(type=int, default=7, help='Days to include (default: 7)')),
+    ]),
+    ('data', 'recent'): ('Show recent data activity', [
+        (('--days',), dict(type=int, default=3, help='Days to show (default: 3)')),
+        (('--type',), dict(choices=('articles', 'analyses'), default='articles', help='Data type to show')),
+        (('--verbose',), dict(action='store_true', help='Show detailed information')),
+    ]),
+    ('integrations', 'test'): ('Test all integrations', [
+        (('--force',), dict(action='store_true', help='Bypass cached probe results')),
+        (('--deep',), dict(action='store_true', help='Make a real OpenAI API call instead of a key check')),
+    ]),
+    ('integrations', 'slack'): ('Slack integration management', [
+        (('--action',), dict(choices=('test', 'send'), default='test', help='Action to perform')),
+        (('--message',), dict(default='Test message from newser CLI',
+                               help='Message to send (for send action)')),
+    ]),
+    ('integrations', 'openai'): ('OpenAI integration management', [
+        (('--action',), dict(choices=('test', 'analyze'), default='test', help='Action to perform')),
+        (('--text',), dict(default='זהו טקסט לדוגמה לבדיקת הניתוח העברי',
+                            help='Text to analyze (for analyze action)')),
+        (('--deep',), dict(action='store_true', help='Make a real OpenAI API call instead of a key check')),
+    ]),
+    ('integrations', 'status'): ('Show integration status', [
+        (('--force',), dict(action='store_true', help='Bypass cached probe results')),
+        (('--deep',), dict(action='store_true', help='Make a real OpenAI API call instead of a key check')),
+    ]),
+    ('health', 'check'): ('Run comprehensive health check', [
+        (('--force',), dict(action='store_true', help='Bypass cached probe results')),
+        (('--json',), dict(action='store_true', help='Print the result as JSON')),
+        (('--quiet',), dict(action='store_true', help='Print nothing; report health through the exit code')),
+    ]),
+    ('health', 'database'): ('Check database health', [
+        (('--force',), dict(action='store_true', help='Bypass cached probe results')),
+        (('--json',), dict(action='store_true', help='Print the result as JSON')),
+        (('--quiet',), dict(action='store_true', help='Print nothing; report health through the exit code')),
+    ]),
+    ('health', 'integrations'): ('Check integration health', [
+        (('--test',), dict(action='store_true', help='Test actual connections')),
+        (('--json',), dict(action='store_true', help='Print the result as JSON')),
+        (('--quiet',), dict(action='store_true', help='Print nothing; report health through the exit code')),
+    ]),
+}
+
+
+def _execute_command(command_name: str, subcommand: str, args: Any) -> int:
+    """Resolve a command lazily and run one of its subcommands."""
+    # Environment is only needed once a command actually executes; .env
+    # never overrides variables the runner already exported
+    from core.env_loader import load_env
+    load_env()
     
-    def route_command(self, args: Optional[List[str]] = None) -> int:
-        """
-        Route command to appropriate handler.
-        
-        Args:
-            args: Command line arguments (uses sys.argv if None)
-            
-        Returns:
-            Exit code
-        """
-        try:
-            if args is None:
-                args = sys.argv[1:]
-            
-            parsed_args = self.parser.parse_args(args)
-            
-            # Handle command structure
-            if not parsed_args.command:
-                self.parser.print_help()
-                return 1
-                
-            return self._handle_command(parsed_args)
-            
-        except SystemExit as e:
-            # argparse calls sys.exit() on error or help
-            return e.code if e.code is not None else 0
-        except Exception as e:
-            logger.error(f"CLI routing error: {e}", exc_info=True)
-            return 1
+    from commands import get_command
     
+    return get_command(command_name).execute(subcommand, args)
+
+
+# (command, subcommand) -> handler; commands are imported on first call
+_ROUTES: Dict[Tuple[str, str], Callable[[Any], int]] = {
+    leaf: partial(_execute_command, *leaf) for leaf in _LEAF_SPECS
+}
+
+# argparse-backed names served from cli_parser on first access
+_PARSER_EXPORTS = ('CLIRouter', 'FastDispatcher')
+
+
+def __getattr__(name: str):
+    """Load the argparse-backed router only when it is asked for (PEP 562)."""
+    if name not in _PARSER_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
     
-    def _handle_command(self, args: argparse.Namespace) -> int:
-        """Handle command structure."""
-        logger.debug(f"Handling command: {args.command}")
-        
-        if args.command not in COMMANDS:
-            available = ', '.join(COMMANDS.keys())
-            logger.error(f"Unknown command '{args.command}'. Available: {available}")
-            return 1
+    import cli_parser
+    value = getattr(cli_parser, name)
+    globals()[name] = value
+    return value
+
+
+def _try_fast_parse(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse simple ``command subcommand [options]`` invocations without argparse.
+    
+    Handles the fixed invocations CI runs (e.g. ``news analyze --updates-only``):
+    exact option names with flag, int, float or single-choice values. Anything
+    else (help, abbreviations, ``--opt=value``, multi-value options, bad
+    values) returns None so argparse can parse it or report the error.
+    
+    Args:
+        argv: Command line arguments (without the program name)
         
-        # Get subcommand
-        subcommand = getattr(args, 'subcommand', None)
-        if not subcommand:
-            logger.error(f"No subcommand specified for '{args.command}'")
-            self.parser.parse_args([args.command, '--help'])  # Show help
-            return 1
+    Returns:
+        Namespace with the attributes argparse would set, or None
+    """
+    if len(argv) < 2:
+        return None
+    leaf = _LEAF_SPECS.get((argv[0], argv[1]))
+    if leaf is None:
+        return None
+    
+    options = {}
+    values = {'command': argv[0], 'subcommand': argv[1]}
+    for flags, kwargs in leaf[1]:
+        dest = kwargs.get('dest') or flags[0].lstrip('-').replace('-', '_')
+        store_true = kwargs.get('action') == 'store_true'
+        values[dest] = kwargs.get('default', False if store_true else None)
+        for flag in flags:
+            options[flag] = (dest, store_true, kwargs)
+    
+    i = 2
+    while i < len(argv):
+        option = options.get(argv[i])
+        if option is None:
+            return None
+        dest, store_true, kwargs = option
+        
+        if store_true:
+            values[dest] = True
+            i += 1
+            continue
+        
+        if 'nargs' in kwargs or i + 1 >= len(argv) or argv[i + 1].startswith('-'):
+            return None
+        value = argv[i + 1]
+        if 'choices' in kwargs and value not in kwargs['choices']:
+            return None
+        convert = kwargs.get('type')
+        if convert is not None:
+            try:
+                value = convert(value)
+            except ValueError:
+                return None
+        values[dest] = value
+        i += 2
+    
+    return SimpleNamespace(**values)
+
+
+def _dispatch(args: Any) -> int:
+    """
+    Run the handler for a parsed ``command subcommand`` invocation.
+    
+    Args:
+        args: Parsed arguments with ``command`` and ``subcommand`` set
         
-        # Execute command
-        try:
-            command = get_command(args.command)
-            return command.execute(subcommand, args)
-        except Exception as e:
-            logger.error(f"Error executing {args.command} {subcommand}: {e}", exc_info=True)
-            return 1
+    Returns:
+        Exit code
+    """
+    _configure_logging()
+    logger.debug(f"Handling command: {args.command}")
+    
+    # Interned so lookups against the interned command names can
+    # short-circuit on identity
+    command_name = sys.intern(args.command)
+    subcommand = getattr(args, 'subcommand', None)
+    if subcommand:
+        subcommand = sys.intern(subcommand)
+    
+    handler = _ROUTES.get((command_name, subcommand))
+    
+    # Execute command
+    try:
+        if handler is None:
+            raise CLIError(f"Unknown command '{command_name} {subcommand}'", command=command_name)
+        return handler(args)
+    except CLIError as e:
+        # Expected usage errors don't need a traceback
+        logger.error(str(e))
+        return 1
+    except Exception as e:
+        logger.error(f"Error executing {command_name} {subcommand}: {e}", exc_info=True)
+        return 1
+
+def _configure_logging() -> None:
+    """Set up root logging for command execution."""
+    handler = logging.StreamHandler()
+    handler.setFormatter(_LOG_FORMATTER)
+    logging.basicConfig(level=logging.INFO, handlers=[handler])
+
+
+def _help_cache_path() -> Path:
+    """Get the on-disk location of the cached help text."""
+    cache_root = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_root) / _HELP_CACHE_FILE
+
+
+def _help_cache_key() -> str:
+    """
+    Build the cache key for rendered help.
+    
+    Help depends on the source of this module and ``cli_parser``, the
+    program name, the terminal width argparse wraps to and the Python
+    version, whose argparse formats help differently, so all of them are
+    part of the key.
+    """
+    parser_source = os.path.join(os.path.dirname(__file__), 'cli_parser.py')
+    mtime_ns = max(os.stat(__file__).st_mtime_ns, os.stat(parser_source).st_mtime_ns)
+    prog = os.path.basename(sys.argv[0])
+    columns = shutil.get_terminal_size().columns
+    python = '.'.join(map(str, sys.version_info[:2]))
+    return f"{mtime_ns} {prog} {columns} {python}"
+
+
+@lru_cache(maxsize=1)
+def _render_help() -> str:
+    """
+    Render the top-level help text, reusing the on-disk cache when valid.
+    
+    Returns:
+        Formatted help text
+    """
+    cache_path = _help_cache_path()
+    key = _help_cache_key()
+    
+    try:
+        cached_key, _, cached_text = cache_path.read_text(encoding='utf-8').partition('\n')
+        if cached_key == key:
+            return cached_text
+    except OSError:
+        pass
+    
+    from cli_parser import CLIRouter
+    help_text = CLIRouter()._create_parser().format_help()
+    
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(f"{key}\n{help_text}", encoding='utf-8')
+    except OSError as e:
+        logger.debug(f"Could not write help cache {cache_path}: {e}")
+    
+    return help_text
 
 
 def main(args: Optional[List[str]] = None) -> int:
@@ -325,13 +365,23 @@ def main(args: Optional[List[str]] = None) -> int:
     Returns:
         Exit code
     """
-    # Set up logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    if args is None:
+        args = sys.argv[1:]
+    
+    # Bare invocations and top-level help are static, so answer them
+    # before any router or parser is constructed
+    if args in _HELP_ARGS:
+        sys.stdout.write(_render_help())
+        return 0 if args else 1
+    
+    # Simple invocations (the CI path) never import argparse
+    parsed_args = _try_fast_parse(args)
+    if parsed_args is not None:
+        return _dispatch(parsed_args)
     
-    # Create and use router
+    # Logging is configured by the router once a command is dispatched,
+    # so help output and argparse errors skip handler setup entirely
+    from cli_parser import CLIRouter
     router = CLIRouter()
     return router.route_command(args)
 
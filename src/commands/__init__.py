@@ -4,39 +4,79 @@ Smart command endpoints for the news aggregator.
 
 This module provides a scalable command architecture where each major
 functionality is handled by dedicated command classes.
+
+Command modules are imported lazily: accessing ``commands.NewsCommand`` or
+calling ``get_command('news')`` loads only ``commands.news`` and its
+dependencies, not every command in the package. Use ``COMMAND_NAMES`` to
+check whether a command exists without importing anything.
 """
 
-from typing import Dict, Type
+import importlib
+from functools import lru_cache
+from typing import Dict, Tuple, Type
+
 from .base import BaseCommand
-from .news import NewsCommand
-from .content import ContentCommand
-from .state import StateCommand
-from .data import DataCommand
-from .integrations import IntegrationsCommand
-from .health import HealthCommand
-
-# Command registry for easy extension
-COMMANDS: Dict[str, Type[BaseCommand]] = {
-    'news': NewsCommand,
-    'content': ContentCommand,
-    'state': StateCommand,
-    'data': DataCommand,
-    'integrations': IntegrationsCommand,
-    'health': HealthCommand,
+from ._names import COMMAND_NAMES
+
+# Command name -> (module, class name) for lazy loading
+_COMMAND_MODULES: Dict[str, Tuple[str, str]] = {
+    'news': ('.news', 'NewsCommand'),
+    'content': ('.content', 'ContentCommand'),
+    'state': ('.state', 'StateCommand'),
+    'data': ('.data', 'DataCommand'),
+    'integrations': ('.integrations', 'IntegrationsCommand'),
+    'health': ('.health', 'HealthCommand'),
+}
+
+# Static command descriptions, so listing commands imports nothing
+_DESCRIPTIONS: Dict[str, str] = {
+    'news': 'Handle news fetching, analysis, and distribution operations.',
+    'content': 'Content management command for full article text fetching.',
+    'state': 'Handle state management operations.',
+    'data': 'Handle data management operations.',
+    'integrations': 'Handle external integration operations.',
+    'health': 'Handle system health monitoring and diagnostics.',
+}
+
+# Class name -> module, used by the module-level __getattr__
+_CLASS_MODULES: Dict[str, str] = {
+    class_name: module for module, class_name in _COMMAND_MODULES.values()
 }
 
+
+def _load_command_class(command_name: str) -> Type[BaseCommand]:
+    """Import the module for a single command and return its class."""
+    module_name, class_name = _COMMAND_MODULES[command_name]
+    module = importlib.import_module(module_name, __name__)
+    return getattr(module, class_name)
+
+
+def __getattr__(name: str):
+    """Resolve command classes on first access (PEP 562)."""
+    module_name = _CLASS_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    command_class = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = command_class
+    return command_class
+
+
+@lru_cache(maxsize=None)
 def get_command(command_name: str) -> BaseCommand:
-    """Get a command instance by name."""
-    if command_name not in COMMANDS:
-        available = ', '.join(COMMANDS.keys())
-        raise ValueError(f"Unknown command '{command_name}'. Available: {available}")
+    """
+    Get a command instance by name.
     
-    command_class = COMMANDS[command_name]
+    Only the requested command's module is imported, and the instance is
+    cached so repeated lookups within a process reuse it.
+    """
+    if command_name not in _COMMAND_MODULES:
+        available = ', '.join(COMMAND_NAMES)
+        raise ValueError(f"Unknown command '{command_name}'. Available: {available}")
+
+    command_class = _load_command_class(command_name)
     return command_class()
 
 def list_commands() -> Dict[str, str]:
     """Get list of available commands with descriptions."""
-    commands = {}
-    for name, command_class in COMMANDS.items():
-        commands[name] = getattr(command_class, '__doc__', 'No description available')
-    return commands
\ No newline at end of file
+    return {name: _DESCRIPTIONS[name] for name in COMMAND_NAMES}
@@ -0,0 +1,29 @@
+"""
+Shared integration clients for the command modules.
+
+The clients are created on first use and reused for the rest of the
+process, so commands probing the same integration share one instance.
+Their modules are imported inside the getters to keep them off the
+startup path of commands that never touch them.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from integrations.openai_client import OpenAIClient
+    from core.notifications.channels.slack import SlackNotifier
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> 'OpenAIClient':
+    """Get the shared OpenAI client, created on first use."""
+    from integrations.openai_client import OpenAIClient
+    return OpenAIClient()
+
+
+@lru_cache(maxsize=1)
+def get_slack_notifier() -> 'SlackNotifier':
+    """Get the shared Slack notifier, created on first use."""
+    from core.notifications.channels.slack import SlackNotifier
+    return SlackNotifier()
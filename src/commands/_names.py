@@ -0,0 +1,14 @@
+"""
+Names of the available CLI commands.
+
+Kept free of heavy imports so the CLI router can validate a command name
+without loading the command modules and their dependencies. Names are
+interned so the router's interned argv strings compare by identity.
+"""
+
+import sys
+
+COMMAND_NAMES = tuple(
+    sys.intern(name)
+    for name in ('news', 'content', 'state', 'data', 'integrations', 'health')
+)
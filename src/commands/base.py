@@ -7,13 +7,67 @@ Uses dependency injection for better testability and maintainability.
 """
 
 import logging
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from contextlib import contextmanager
+from functools import cached_property, wraps
+from typing import Callable, ClassVar, Iterator, List, Optional, Tuple
 from argparse import Namespace
-from core.container import get_container
+from core.container import Container, get_container
 
 logger = logging.getLogger(__name__)
 
+# Public BaseCommand methods that legacy discovery must not report
+_SKIP_METHODS = frozenset({'execute', 'get_available_subcommands', 'handle_error'})
+
+# Exception type -> process exit code; subclasses match in this order
+_EXIT_CODES = {
+    KeyboardInterrupt: 130,
+    FileNotFoundError: 2,
+    PermissionError: 13,
+    ValueError: 22,
+}
+
+
+def command_handler(context: str) -> Callable:
+    """
+    Decorate a subcommand handler so failures go through ``handle_error``.
+    
+    Args:
+        context: Operation name used when logging a failure
+        
+    Returns:
+        Decorator wrapping a ``handler(self, args) -> int`` method
+    """
+    def decorator(handler: Callable) -> Callable:
+        @wraps(handler)
+        def wrapper(self, args: Namespace) -> int:
+            try:
+                return handler(self, args)
+            except Exception as e:
+                return self.handle_error(e, context)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def buffered_output() -> Iterator[Callable[[str], None]]:
+    """
+    Collect report lines and write them to stdout in a single call.
+    
+    The lines are flushed on exit even if the block raises, so a failing
+    command still shows what it reported before the error.
+    
+    Returns:
+        Context manager yielding a ``print``-like function for one line
+    """
+    lines: List[str] = []
+    try:
+        yield lines.append
+    finally:
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+
 
 class BaseCommand(ABC):
     """
@@ -22,9 +76,24 @@ class BaseCommand(ABC):
     Provides common infrastructure like data management, metrics collection,
     and error handling that all commands can use. Uses dependency injection
     container for managing service instances.
+    
+    Service accessors resolve their container singleton on first use and
+    keep it on the instance, so later reads are plain attribute loads.
     """
     
-    def __init__(self, container=None):
+    # Exit codes returned by command handlers
+    SUCCESS: ClassVar[int] = 0
+    FAILURE: ClassVar[int] = 1
+    USAGE_ERROR: ClassVar[int] = 2
+    INTERRUPTED: ClassVar[int] = 130
+    
+    # Subcommand names, declared by each concrete command
+    _SUBCOMMANDS: ClassVar[Tuple[str, ...]] = ()
+    # Fall back to discovering public methods via dir() (slow, and it
+    # evaluates every service property along the way)
+    _DISCOVER_SUBCOMMANDS: ClassVar[bool] = False
+    
+    def __init__(self, container: Optional[Container] = None):
         """
         Initialize base command with dependency injection container.
         
@@ -32,39 +101,41 @@ class BaseCommand(ABC):
             container: Optional container instance. If None, uses global container.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._container = container or get_container()
+        # get_container() is already a process-wide singleton; it is not
+        # cached here so reset_container() still takes effect
+        self._container = container if container is not None else get_container()
     
-    @property
+    @cached_property
     def config(self):
         """Get configuration from container."""
         return self._container.get('config')
     
-    @property
+    @cached_property
     def data_manager(self):
         """Get data manager from container."""
         return self._container.get('data_manager')
     
-    @property
+    @cached_property
     def metrics(self):
         """Get metrics collector from container."""
         return self._container.get('metrics_collector')
     
-    @property
+    @cached_property
     def database(self):
         """Get database instance from container."""
         return self._container.get('database')
     
-    @property
+    @cached_property
     def security_validator(self):
         """Get security validator from container."""
         return self._container.get('security_validator')
     
-    @property
+    @cached_property
     def feed_parser(self):
         """Get feed parser from container."""
         return self._container.get('feed_parser')
     
-    @property
+    @cached_property
     def state_manager(self):
         """Get state manager from container."""
         return self._container.get('state_manager')
@@ -96,21 +167,29 @@ class BaseCommand(ABC):
         """
         pass
     
-    def get_available_subcommands(self) -> List[str]:
+    def get_available_subcommands(self) -> Tuple[str, ...]:
         """
-        Get list of available subcommands for this command.
+        Get available subcommands for this command.
         
         Returns:
-            List of subcommand names
+            Subcommand names
         """
-        # Default implementation looks for methods that don't start with _
+        if not self._DISCOVER_SUBCOMMANDS:
+            return self._SUBCOMMANDS
+        
+        # Legacy discovery looks for methods that don't start with _
         methods = []
         for attr_name in dir(self):
             if not attr_name.startswith('_') and callable(getattr(self, attr_name)):
                 # Skip inherited methods from base class
-                if attr_name not in ['execute', 'get_available_subcommands', 'handle_error']:
+                if attr_name not in _SKIP_METHODS:
                     methods.append(attr_name)
-        return methods
+        return tuple(methods)
+    
+    @cached_property
+    def _available_subcommands_str(self) -> str:
+        """Comma-separated subcommand names for error messages."""
+        return ", ".join(self.get_available_subcommands())
     
     def handle_error(self, error: Exception, context: str = "") -> int:
         """
@@ -123,23 +202,26 @@ class BaseCommand(ABC):
         Returns:
             Appropriate exit code
         """
-        error_msg = f"{context}: {error}" if context else str(error)
-        self.logger.error(error_msg, exc_info=True)
+        if context:
+            self.logger.error("%s: %s", context, error, exc_info=True)
+        else:
+            self.logger.error("%s", error, exc_info=True)
+        
+        # Map common exceptions to exit codes, exact type first
+        code = _EXIT_CODES.get(type(error))
+        if code is None:
+            for error_type, error_code in _EXIT_CODES.items():
+                if isinstance(error, error_type):
+                    code = error_code
+                    break
+            else:
+                return self.FAILURE
         
-        # Map common exceptions to exit codes
         if isinstance(error, KeyboardInterrupt):
             self.logger.info("Command interrupted by user")
-            return 130
-        elif isinstance(error, FileNotFoundError):
-            return 2
-        elif isinstance(error, PermissionError):
-            return 13
-        elif isinstance(error, ValueError):
-            return 22
-        else:
-            return 1
+        return code
     
-    def validate_args(self, args: Namespace, required_args: List[str] = None) -> bool:
+    def validate_args(self, args: Namespace, required_args: Optional[List[str]] = None) -> bool:
         """
         Validate that required arguments are present.
         
@@ -154,12 +236,13 @@ class BaseCommand(ABC):
             return True
             
         missing = []
+        missing_append = missing.append
         for arg_name in required_args:
-            if not hasattr(args, arg_name) or getattr(args, arg_name) is None:
-                missing.append(arg_name)
+            if getattr(args, arg_name, None) is None:
+                missing_append(arg_name)
         
         if missing:
-            self.logger.error(f"Missing required arguments: {', '.join(missing)}")
+            self.logger.error("Missing required arguments: %s", ', '.join(missing))
             return False
             
         return True
\ No newline at end of file
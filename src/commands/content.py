@@ -3,23 +3,47 @@ Content command for managing full article content fetching.
 """
 
 import logging
-from typing import Dict, Any
+import sys
+from collections import Counter
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Any
 
-from .base import BaseCommand
-from core.content.service import ContentService
-from core.adapters.supabase_api import SupabaseApiAdapter
+from .base import BaseCommand, command_handler
+
+if TYPE_CHECKING:
+    from core.content.service import FetchResult
 
 logger = logging.getLogger(__name__)
 
+# PostgREST / PostgreSQL error codes for a function that does not exist
+_MISSING_FUNCTION_CODES = ('PGRST202', '42883')
+
 
 class ContentCommand(BaseCommand):
     """Content management command for full article text fetching."""
     
+    _SUBCOMMANDS = ('fetch', 'status', 'reset')
+    
     def __init__(self):
         """Initialize content command."""
         super().__init__()
-        self.supabase_api = SupabaseApiAdapter()
-        self.content_service = ContentService(self.supabase_api)
+        self._dispatch = {
+            'fetch': self._handle_fetch,
+            'status': self._handle_status,
+            'reset': self._handle_reset,
+        }
+    
+    @cached_property
+    def supabase_api(self):
+        """Get the Supabase API adapter, connecting on first use."""
+        from core.adapters.supabase_api import SupabaseApiAdapter
+        return SupabaseApiAdapter()
+    
+    @cached_property
+    def content_service(self):
+        """Get the content service backed by the Supabase adapter."""
+        from core.content.service import ContentService
+        return ContentService(self.supabase_api)
     
     def execute(self, subcommand: str, args) -> int:
         """
@@ -32,112 +56,137 @@ class ContentCommand(BaseCommand):
         Returns:
             Exit code
         """
-        try:
-            if subcommand == 'fetch':
-                return self._handle_fetch(args)
-            elif subcommand == 'status':
-                return self._handle_status(args)
-            elif subcommand == 'reset':
-                return self._handle_reset(args)
-            else:
-                logger.error(f"Unknown content subcommand: {subcommand}")
-                return 1
-                
-        except Exception as e:
-            logger.error(f"Content command failed: {e}")
-            return 1
+        handler = self._dispatch.get(subcommand)
+        if handler is None:
+            logger.error("Unknown content subcommand: %s", subcommand)
+            return self.FAILURE
+        return handler(args)
+    
+    def reset_failed_if_requested(self, args) -> None:
+        """
+        Reset failed articles to pending when ``--reset-failed`` was given.
+        
+        Args:
+            args: Parsed arguments with reset_failed and reset_hours
+        """
+        if args.reset_failed:
+            logger.info("Resetting failed articles from last %d hours", args.reset_hours)
+            self.content_service.reset_failed_articles(hours=args.reset_hours)
     
+    def fetch_results(self, args) -> 'FetchResult':
+        """
+        Reset failed articles if requested, then fetch pending content.
+        
+        Args:
+            args: Parsed arguments with reset_failed, reset_hours and max_articles
+            
+        Returns:
+            Per-status counts for the fetched articles
+        """
+        self.reset_failed_if_requested(args)
+        
+        logger.info("Fetching content for up to %d articles", args.max_articles)
+        return self.content_service.fetch_pending_content(args.max_articles)
+    
+    @command_handler("content fetch")
     def _handle_fetch(self, args) -> int:
         """Handle content fetch subcommand."""
-        try:
-            logger.info("Starting content fetch operation")
-            
-            # Reset failed articles if requested
-            if args.reset_failed:
-                logger.info(f"Resetting failed articles from last {args.reset_hours} hours")
-                self.content_service.reset_failed_articles(hours=args.reset_hours)
-            
-            # Fetch content for pending articles
-            logger.info(f"Fetching content for up to {args.max_articles} articles")
-            results = self.content_service.fetch_pending_content(args.max_articles)
-            
-            # Report results
-            total_processed = sum(results.values())
-            logger.info(f"Content fetch completed:")
-            logger.info(f"  Success: {results['success']}")
-            logger.info(f"  Failed: {results['failed']}")
-            logger.info(f"  Skipped: {results['skipped']}")
-            logger.info(f"  Total processed: {total_processed}")
-            
-            if results['success'] > 0:
-                logger.info("✅ Content fetch successful")
-                return 0
-            elif total_processed == 0:
-                logger.info("ℹ️ No articles needed content fetching")
-                return 0
-            else:
-                logger.warning("⚠️ Content fetch completed with some failures")
-                return 0  # Don't fail the command for partial failures
-                
-        except Exception as e:
-            logger.error(f"Content fetch failed: {e}")
-            return 1
+        logger.info("Starting content fetch operation")
+        results = self.fetch_results(args)
+        
+        # Report results
+        log = logger.info
+        success, failed, skipped = results
+        total_processed = success + failed + skipped
+        log("Content fetch completed:")
+        log("  Success: %d", success)
+        log("  Failed: %d", failed)
+        log("  Skipped: %d", skipped)
+        log("  Total processed: %d", total_processed)
+        
+        if success > 0:
+            log("✅ Content fetch successful")
+            return self.SUCCESS
+        elif total_processed == 0:
+            log("ℹ️ No articles needed content fetching")
+            return self.SUCCESS
+        else:
+            logger.warning("⚠️ Content fetch completed with some failures")
+            return self.SUCCESS  # Don't fail the command for partial failures
     
+    @command_handler("content status")
     def _handle_status(self, args) -> int:
         """Handle content status subcommand."""
+        log = logger.info
+        log("Checking content status for last %d hours", args.hours)
+        
+        # Get articles needing content
+        pending_articles = self.content_service.get_articles_needing_content(limit=100)
+        
+        # Get articles with content
+        articles_with_content = self.content_service.get_articles_with_content(
+            hours=args.hours, limit=100
+        )
+        
+        status_counts = self._status_counts()
+        
+        # Report status
+        log("📊 Content Fetch Status:")
+        log("  Pending: %d articles", len(pending_articles))
+        log("  With content (last %dh): %d articles", args.hours, len(articles_with_content))
+        
+        if status_counts:
+            log("📈 Overall Status Breakdown:")
+            for status, count in status_counts.items():
+                log("  %s: %s", status.capitalize(), count)
+        
+        return self.SUCCESS
+    
+    def _status_counts(self) -> Dict[str, int]:
+        """
+        Count articles per fetch status.
+        
+        Counts are aggregated server-side into at most one row per status
+        (database/migrations/002_article_status_counts.sql). Until that
+        migration is applied, every article's status is downloaded and
+        counted here instead.
+        
+        Returns:
+            Mapping of fetch status to article count
+        """
+        from postgrest.exceptions import APIError
+        
         try:
-            logger.info(f"Checking content status for last {args.hours} hours")
-            
-            # Get articles needing content
-            pending_articles = self.content_service.get_articles_needing_content(limit=100)
-            
-            # Get articles with content
-            articles_with_content = self.content_service.get_articles_with_content(
-                hours=args.hours, limit=100
+            response = self.supabase_api.client.rpc('article_status_counts').execute()
+        except APIError as e:
+            if e.code not in _MISSING_FUNCTION_CODES:
+                raise
+            logger.warning(
+                "article_status_counts() not found; apply "
+                "database/migrations/002_article_status_counts.sql. "
+                "Counting statuses client-side for now."
             )
-            
-            # Get status counts from database
-            response = self.supabase_api.client.table('articles').select(
-                'fetch_status', count='exact'
-            ).execute()
-            
-            status_counts = {}
-            if response.data:
-                for row in response.data:
-                    status = row.get('fetch_status') or 'pending'
-                    status_counts[status] = status_counts.get(status, 0) + 1
-            
-            # Report status
-            logger.info("📊 Content Fetch Status:")
-            logger.info(f"  Pending: {len(pending_articles)} articles")
-            logger.info(f"  With content (last {args.hours}h): {len(articles_with_content)} articles")
-            
-            if status_counts:
-                logger.info("📈 Overall Status Breakdown:")
-                for status, count in status_counts.items():
-                    logger.info(f"  {status.capitalize()}: {count}")
-            
-            return 0
-            
-        except Exception as e:
-            logger.error(f"Status check failed: {e}")
-            return 1
+            response = self.supabase_api.client.table('articles').select('fetch_status').execute()
+            return dict(Counter(row.get('fetch_status') or 'pending' for row in response.data or ()))
+        
+        # NULL statuses are already reported as 'pending' by the function
+        return {row['fetch_status']: row['count'] for row in response.data or ()}
     
+    @command_handler("content reset")
     def _handle_reset(self, args) -> int:
         """Handle content reset subcommand."""
-        try:
-            if not args.force:
-                response = input(f"Reset content fetch status for articles from last {args.hours} hours? (y/N): ")
-                if response.lower() not in ['y', 'yes']:
-                    logger.info("Reset cancelled")
-                    return 0
-            
-            logger.info(f"Resetting content fetch status for last {args.hours} hours")
-            self.content_service.reset_failed_articles(hours=args.hours)
-            
-            logger.info("✅ Content fetch status reset completed")
-            return 0
-            
-        except Exception as e:
-            logger.error(f"Reset failed: {e}")
-            return 1
+        if not args.force:
+            # Without a terminal there is nobody to answer the prompt
+            if not sys.stdin.isatty():
+                logger.error("Reset requires --force in non-interactive mode")
+                return self.USAGE_ERROR
+            response = input(f"Reset content fetch status for articles from last {args.hours} hours? (y/N): ")
+            if response.strip().lower() not in ('y', 'yes'):
+                logger.info("Reset cancelled")
+                return self.SUCCESS
+        
+        logger.info("Resetting content fetch status for last %d hours", args.hours)
+        self.content_service.reset_failed_articles(hours=args.hours)
+        
+        logger.info("✅ Content fetch status reset completed")
+        return self.SUCCESS
@@ -5,18 +5,21 @@ Command for fetching full article content.
 import logging
 from typing import Dict, Any
 
-from ..core.content.service import ContentService
-from ..core.adapters.supabase_api import SupabaseAPI
+from .content import ContentCommand
 
 logger = logging.getLogger(__name__)
 
 
 class FetchContentCommand:
-    """Command for fetching full article content."""
+    """
+    Command for fetching full article content.
+    
+    Thin adapter over ``ContentCommand``'s fetch that reports a result
+    dictionary instead of an exit code, for programmatic callers.
+    """
     
     def __init__(self):
-        self.supabase_api = SupabaseAPI()
-        self.content_service = ContentService(self.supabase_api)
+        self._content = ContentCommand()
     
     def execute(self, args) -> Dict[str, Any]:
         """
@@ -29,26 +32,21 @@ class FetchContentCommand:
             Dictionary with execution results
         """
         try:
-            if args.reset_failed:
-                logger.info("Resetting failed articles to pending status")
-                self.content_service.reset_failed_articles(hours=args.reset_hours)
-            
             if args.max_articles > 0:
-                logger.info(f"Fetching content for up to {args.max_articles} articles")
-                results = self.content_service.fetch_pending_content(args.max_articles)
-                
+                results = self._content.fetch_results(args)
                 logger.info(f"Content fetch completed: {results}")
-                return {
-                    'success': True,
-                    'results': results,
-                    'message': f"Processed {sum(results.values())} articles"
-                }
+                message = f"Processed {sum(results)} articles"
             else:
-                return {
-                    'success': True,
-                    'results': {'success': 0, 'failed': 0, 'skipped': 0},
-                    'message': "No articles processed (max_articles=0)"
-                }
+                self._content.reset_failed_if_requested(args)
+                from core.content.service import FetchResult
+                results = FetchResult(0, 0, 0)
+                message = "No articles processed (max_articles=0)"
+            
+            return {
+                'success': True,
+                'results': results._asdict(),
+                'message': message
+            }
                 
         except Exception as e:
             logger.error(f"Content fetch command failed: {e}")
@@ -5,219 +5,458 @@ Health check command for monitoring system status.
 Provides comprehensive health checks for database, integrations, and system components.
 """
 
+import asyncio
+import json
 import logging
+import os
+import sys
 from argparse import Namespace
-from typing import Dict, Any
+from functools import partial
+from typing import Any, Callable, ClassVar, Dict, Optional
 
-from .base import BaseCommand
+from .base import BaseCommand, buffered_output
+from ._clients import get_openai_client, get_slack_notifier
 from core.database import get_database, DatabaseError
 from core.env_loader import validate_database_config
-from core.cache import get_cache_stats, clear_all_caches
-from integrations.openai_client import OpenAIClient
-from core.notifications.channels.slack import SlackNotifier
+from core.cache import get_cache_stats, cached_probe
 
 logger = logging.getLogger(__name__)
 
+# Fixed report headings, built once rather than on every run
+_CHECK_RULE = "\n" + "=" * 50
+_CHECK_BANNER = "🏥 System Health Check\n" + "=" * 50
+_DATABASE_BANNER = "📊 Database Health Check\n" + "=" * 30
+_INTEGRATIONS_BANNER = "🔌 Integration Health Check\n" + "=" * 35
+
+
+# Client probe name -> (environment variable it requires, factory)
+_CLIENT_PROBES = {
+    'openai': ('OPENAI_API_KEY', get_openai_client),
+    'slack': ('SLACK_WEBHOOK_URL', get_slack_notifier),
+}
+
+
+def _missing_env(key: str) -> ValueError:
+    """Build the error reported for an unset client environment variable."""
+    return ValueError(f"{key} environment variable is not set")
+
+
+def _hit_rate(stats: Dict[str, Any]) -> float:
+    """
+    Compute a cache hit rate from its raw counters.
+    
+    Stale hits, for caches that report them, still served a value and count
+    as hits. Without counters the cache's own ``hit_rate`` is used.
+    
+    Args:
+        stats: Statistics for one cache instance
+        
+    Returns:
+        Hit rate as a percentage
+    """
+    if 'hits' not in stats and 'misses' not in stats:
+        return stats.get('hit_rate', 0)
+    
+    served = stats.get('hits', 0) + stats.get('stale_hits', 0)
+    total = served + stats.get('misses', 0)
+    return served / total * 100 if total else 0.0
+
+
+def _run_probes(probes: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """
+    Run independent blocking probes concurrently in worker threads.
+    
+    Args:
+        probes: Probe name -> zero-argument callable
+        
+    Returns:
+        Probe name -> result, or the exception the probe raised
+    """
+    async def gather() -> Dict[str, Any]:
+        results = await asyncio.gather(
+            *(asyncio.to_thread(probe) for probe in probes.values()),
+            return_exceptions=True
+        )
+        return dict(zip(probes, results))
+    
+    return asyncio.run(gather())
+
 
 class HealthCommand(BaseCommand):
     """Handle system health monitoring and diagnostics."""
     
+    # Subcommand -> handler method name
+    _HANDLERS: ClassVar[Dict[str, str]] = {
+        'check': 'check',
+        'database': 'database',
+        'integrations': 'integrations',
+    }
+    _SUBCOMMANDS = tuple(_HANDLERS)
+    
+    # Memoized result of _collect_db_status
+    _db_status: Optional[Dict[str, Any]] = None
+    
     def execute(self, subcommand: str, args: Namespace) -> int:
         """Execute health subcommand."""
+        handler_name = self._HANDLERS.get(subcommand)
+        if handler_name is None:
+            available = self._available_subcommands_str
+            self.logger.error(f"Unknown subcommand '{subcommand}'. Available: {available}")
+            return self.FAILURE
+        
+        if args.quiet:
+            # Keep probe chatter out of the output as well
+            logging.getLogger().setLevel(logging.WARNING)
+        
         try:
-            if subcommand == "check":
-                return self.check(args)
-            elif subcommand == "database":
-                return self.database(args)
-            elif subcommand == "integrations":
-                return self.integrations(args)
-            else:
-                available = ", ".join(self.get_available_subcommands())
-                self.logger.error(f"Unknown subcommand '{subcommand}'. Available: {available}")
-                return 1
-                
+            return getattr(self, handler_name)(args)
         except Exception as e:
             return self.handle_error(e, f"health {subcommand}")
     
-    def check(self, args: Namespace) -> int:
-        """Run comprehensive health check."""
-        print("🏥 System Health Check")
-        print("=" * 50)
+    def _collect_db_status(self, full: bool = False, force: bool = False) -> Dict[str, Any]:
+        """
+        Validate the database configuration and probe the connection.
         
-        overall_healthy = True
+        The result is kept on the instance, so later calls in the same
+        invocation reuse it instead of querying the database again.
         
-        # Database health
-        print("\n📊 Database Status:")
-        try:
-            db = get_database()
-            health = db.health_check()
+        Args:
+            full: Collect table statistics and the known item hashes rather
+                than only confirming the connection
+            force: Ignore the memoized and cached probe results
             
-            if health.get('connected'):
-                print("  ✅ Database connection: OK")
-                
-                tables = health.get('tables', {})
-                for table, count in tables.items():
-                    print(f"  📋 {table}: {count} records")
+        Returns:
+            Dict with 'config_error' (None when valid), 'health' and, if
+            full, 'known_items'; a failed step holds its exception
+        """
+        status = None if force else self._db_status
+        if status is None:
+            status = {'config_error': None, 'full': False}
+            try:
+                validate_database_config()
+            except Exception as e:
+                status['config_error'] = e
+            self._db_status = status
+        
+        if 'health' not in status or (full and not status['full']):
+            try:
+                db = get_database()
+                status['health'] = cached_probe(
+                    'database_full' if full else 'database',
+                    partial(db.health_check, full=full),
+                    force=force,
+                    succeeded=lambda health: bool(health.get('connected'))
+                )
+            except Exception as e:
+                status['health'] = e
+            status['full'] = full
+        
+        if full and 'known_items' not in status:
+            health = status['health']
+            if isinstance(health, Exception) or not health.get('connected'):
+                status['known_items'] = None
             else:
-                print("  ❌ Database connection: FAILED")
-                print(f"     Error: {health.get('error', 'Unknown error')}")
-                overall_healthy = False
-                
-        except Exception as e:
-            print(f"  ❌ Database check failed: {e}")
-            overall_healthy = False
+                try:
+                    status['known_items'] = get_database().get_known_items()
+                except Exception as e:
+                    status['known_items'] = e
         
-        # Configuration validation
-        print("\n⚙️  Configuration:")
-        try:
-            validate_database_config()
-            print("  ✅ Database configuration: OK")
-        except Exception as e:
-            print(f"  ❌ Database configuration: {e}")
-            overall_healthy = False
+        return status
+    
+    def _render(self, result: Dict[str, Any], args: Namespace,
+                render_text: Callable[[Dict[str, Any], Callable[[str], None]], None]) -> int:
+        """
+        Write a health result as compact JSON or as the human-readable report.
         
-        # Integration status
-        print("\n🔌 Integration Status:")
+        Nothing is written with ``--quiet``; the exit code alone reports
+        the result.
         
-        # OpenAI check
-        try:
-            openai_client = OpenAIClient()
-            print("  ✅ OpenAI configuration: OK")
-        except Exception as e:
-            print(f"  ❌ OpenAI configuration: {e}")
-            overall_healthy = False
+        Args:
+            result: Health result with a boolean 'healthy' entry
+            args: Parsed arguments with ``json`` and ``quiet`` flags
+            render_text: Function writing the text report through ``emit``
+            
+        Returns:
+            Exit code derived from the result
+        """
+        if args.json and not args.quiet:
+            sys.stdout.write(json.dumps(result, separators=(',', ':'), default=str) + "\n")
+        elif not args.quiet:
+            with buffered_output() as emit:
+                render_text(result, emit)
+        return self.SUCCESS if result['healthy'] else self.FAILURE
+    
+    def check(self, args: Namespace) -> int:
+        """Run comprehensive health check."""
+        return self._render(self._check_result(args), args, _render_check_text)
+    
+    def _check_result(self, args: Namespace) -> Dict[str, Any]:
+        """Probe every component and collect the comprehensive health result."""
+        db_status = self._collect_db_status(force=args.force)
         
-        # Slack check
-        try:
-            slack_client = SlackNotifier()
-            print("  ✅ Slack configuration: OK")
-        except Exception as e:
-            print(f"  ❌ Slack configuration: {e}")
-            overall_healthy = False
+        # Clients whose key is unset are reported without being built; the
+        # remaining client probes are independent and run concurrently
+        results = {}
+        probes = {}
+        for name, (env_key, factory) in _CLIENT_PROBES.items():
+            if os.getenv(env_key):
+                probes[name] = factory
+            else:
+                results[name] = _missing_env(env_key)
+        if probes:
+            results.update(_run_probes(probes))
+        
+        # Database health
+        health = db_status['health']
+        if isinstance(health, Exception):
+            database = {'status': 'error', 'error': str(health)}
+        elif health.get('connected'):
+            database = {'status': 'ok', 'tables': health.get('tables', {})}
+        else:
+            database = {'status': 'failed', 'error': health.get('error', 'Unknown error')}
         
-        # Cache status
-        print("\n💾 Cache Status:")
+        config_error = db_status['config_error']
+        integrations = {
+            name: {'ok': not isinstance(results[name], Exception),
+                   'error': str(results[name]) if isinstance(results[name], Exception) else None}
+            for name in _CLIENT_PROBES
+        }
+        
+        # Cache status is informational; a failure doesn't make the system unhealthy
         try:
             cache_stats = get_cache_stats()
-            if cache_stats:
-                for cache_name, stats in cache_stats.items():
-                    hit_rate = stats.get('hit_rate', 0)
-                    entries = stats.get('entries', 0)
-                    print(f"  📊 {cache_name.title()} Cache: {entries} entries, {hit_rate:.1f}% hit rate")
-                print("  ✅ Cache system: OK")
-            else:
-                print("  ℹ️  No cache instances active")
+            for stats in cache_stats.values():
+                stats['hit_rate'] = _hit_rate(stats)
+            cache = {'stats': cache_stats, 'error': None}
         except Exception as e:
-            print(f"  ⚠️  Cache check failed: {e}")
-            # Don't mark as unhealthy since cache is not critical
+            cache = {'stats': {}, 'error': str(e)}
         
-        # Async Feed Parser check
-        print("\n⚡ Async RSS Fetching:")
         try:
             from core.async_feed_parser import AsyncFeedParser
-            print("  ✅ Async RSS parser available")
-            print("  ℹ️  Use --async flag with news commands for parallel fetching")
+            async_rss = {'ok': True, 'error': None}
         except ImportError as e:
-            print(f"  ❌ Async RSS parser not available: {e}")
-            overall_healthy = False
-        
-        # Summary
-        print("\n" + "=" * 50)
-        if overall_healthy:
-            print("✅ Overall Status: HEALTHY")
-            return 0
-        else:
-            print("❌ Overall Status: UNHEALTHY")
-            return 1
+            async_rss = {'ok': False, 'error': str(e)}
+        
+        healthy = (
+            database['status'] == 'ok'
+            and config_error is None
+            and all(entry['ok'] for entry in integrations.values())
+            and async_rss['ok']
+        )
+        return {
+            'healthy': healthy,
+            'database': database,
+            'config': {'ok': config_error is None,
+                       'error': None if config_error is None else str(config_error)},
+            'integrations': integrations,
+            'cache': cache,
+            'async_rss': async_rss,
+        }
     
     def database(self, args: Namespace) -> int:
         """Check database health specifically."""
-        print("📊 Database Health Check")
-        print("=" * 30)
+        return self._render(self._database_result(args), args, _render_database_text)
+    
+    def _database_result(self, args: Namespace) -> Dict[str, Any]:
+        """Collect the detailed database health result."""
+        status = self._collect_db_status(full=True, force=args.force)
+        result = {
+            'healthy': False,
+            'config_valid': status['config_error'] is None,
+            'error': None,
+            'error_type': None,
+        }
         
-        try:
-            # Configuration check
-            validate_database_config()
-            print("✅ Database configuration valid")
-            
-            # Connection test
-            db = get_database()
-            health = db.health_check()
-            
-            if health.get('connected'):
-                print("✅ Database connection successful")
-                
-                # Table statistics
-                tables = health.get('tables', {})
-                if tables:
-                    print("\n📋 Table Statistics:")
-                    for table, count in tables.items():
-                        print(f"  • {table}: {count:,} records")
-                
-                # Test a simple query
-                known_items = db.get_known_items()
-                print(f"\n🔍 Known items: {len(known_items)} hashes")
-                
-                return 0
-            else:
-                print(f"❌ Database connection failed: {health.get('error')}")
-                return 1
-                
-        except DatabaseError as e:
-            print(f"❌ Database error: {e}")
-            return 1
-        except Exception as e:
-            print(f"❌ Unexpected error: {e}")
-            return 1
+        error = status['config_error']
+        if error is None:
+            health = status['health']
+            error = health if isinstance(health, Exception) else status['known_items']
+        
+        if isinstance(error, Exception):
+            result['error'] = str(error)
+            result['error_type'] = 'database' if isinstance(error, DatabaseError) else 'unexpected'
+        elif not health.get('connected'):
+            result['error'] = health.get('error')
+            result['error_type'] = 'connection'
+        else:
+            result.update(
+                healthy=True,
+                tables=health.get('tables', {}),
+                known_items=len(status['known_items']),
+            )
+        return result
     
     def integrations(self, args: Namespace) -> int:
         """Test external integrations."""
-        print("🔌 Integration Health Check")
-        print("=" * 35)
-        
-        success_count = 0
-        total_count = 0
-        
-        # Test OpenAI
-        print("\n🤖 OpenAI Integration:")
-        total_count += 1
-        try:
-            openai_client = OpenAIClient()
-            # Try a simple test (without making actual API call)
-            print("  ✅ OpenAI client initialized successfully")
-            print("  ℹ️  API key configured and valid format")
-            success_count += 1
-        except Exception as e:
-            print(f"  ❌ OpenAI integration failed: {e}")
+        return self._render(self._integrations_result(args), args, _render_integrations_text)
+    
+    def _integrations_result(self, args: Namespace) -> Dict[str, Any]:
+        """Initialize the integration clients and optionally test Slack."""
+        # OpenAI: client initialization only, without making an API call
+        openai = {'ok': False, 'error': None}
+        if not os.getenv('OPENAI_API_KEY'):
+            openai['error'] = str(_missing_env('OPENAI_API_KEY'))
+        else:
+            try:
+                get_openai_client()
+                openai['ok'] = True
+            except Exception as e:
+                openai['error'] = str(e)
         
-        # Test Slack
-        print("\n📱 Slack Integration:")
-        total_count += 1
-        try:
-            slack_client = SlackNotifier()
-            
-            # Test connection (if --test flag provided)
-            if getattr(args, 'test', False):
-                print("  🧪 Testing Slack webhook...")
-                if slack_client.test_connection():
-                    print("  ✅ Slack webhook test successful")
-                    success_count += 1
+        # Slack: test the webhook only if --test flag provided
+        slack = {'ok': False, 'error': None, 'tested': False}
+        if not os.getenv('SLACK_WEBHOOK_URL'):
+            slack['error'] = str(_missing_env('SLACK_WEBHOOK_URL'))
+        else:
+            try:
+                slack_client = get_slack_notifier()
+                if args.test:
+                    slack['tested'] = True
+                    slack['ok'] = bool(slack_client.test_connection())
                 else:
-                    print("  ❌ Slack webhook test failed")
-            else:
-                print("  ✅ Slack client initialized successfully")
-                print("  ℹ️  Use --test flag to test webhook")
-                success_count += 1
-                
-        except Exception as e:
-            print(f"  ❌ Slack integration failed: {e}")
+                    slack['ok'] = True
+            except Exception as e:
+                slack['error'] = str(e)
         
-        # Summary
-        print(f"\n📊 Integration Summary: {success_count}/{total_count} healthy")
+        success_count = openai['ok'] + slack['ok']
+        return {
+            'healthy': success_count == 2,
+            'openai': openai,
+            'slack': slack,
+            'success_count': success_count,
+            'total_count': 2,
+        }
+
+
+def _render_check_text(result: Dict[str, Any], emit: Callable[[str], None]) -> None:
+    """Write the comprehensive health check report."""
+    emit(_CHECK_BANNER)
+    
+    # Database health
+    emit("\n📊 Database Status:")
+    database = result['database']
+    if database['status'] == 'error':
+        emit(f"  ❌ Database check failed: {database['error']}")
+    elif database['status'] == 'ok':
+        emit("  ✅ Database connection: OK")
         
-        if success_count == total_count:
-            print("✅ All integrations healthy")
-            return 0
+        tables = database['tables']
+        if tables:
+            emit("\n".join([
+                f"  📋 {table}: {count} records" for table, count in tables.items()
+            ]))
+    else:
+        emit("  ❌ Database connection: FAILED")
+        emit(f"     Error: {database['error']}")
+    
+    # Configuration validation
+    emit("\n⚙️  Configuration:")
+    if result['config']['ok']:
+        emit("  ✅ Database configuration: OK")
+    else:
+        emit(f"  ❌ Database configuration: {result['config']['error']}")
+    
+    # Integration status
+    emit("\n🔌 Integration Status:")
+    for name, label in (('openai', 'OpenAI'), ('slack', 'Slack')):
+        entry = result['integrations'][name]
+        if entry['ok']:
+            emit(f"  ✅ {label} configuration: OK")
         else:
-            print("⚠️  Some integrations have issues")
-            return 1
+            emit(f"  ❌ {label} configuration: {entry['error']}")
+    
+    # Cache status
+    emit("\n💾 Cache Status:")
+    cache = result['cache']
+    if cache['error'] is not None:
+        emit(f"  ⚠️  Cache check failed: {cache['error']}")
+    elif cache['stats']:
+        emit("\n".join([
+            f"  📊 {cache_name.title()} Cache: {stats.get('entries', 0)} entries, "
+            f"{stats.get('hit_rate', 0):.1f}% hit rate"
+            for cache_name, stats in cache['stats'].items()
+        ]))
+        emit("  ✅ Cache system: OK")
+    else:
+        emit("  ℹ️  No cache instances active")
+    
+    # Async Feed Parser check
+    emit("\n⚡ Async RSS Fetching:")
+    if result['async_rss']['ok']:
+        emit("  ✅ Async RSS parser available")
+        emit("  ℹ️  Use --async flag with news commands for parallel fetching")
+    else:
+        emit(f"  ❌ Async RSS parser not available: {result['async_rss']['error']}")
+    
+    # Summary
+    emit(_CHECK_RULE)
+    if result['healthy']:
+        emit("✅ Overall Status: HEALTHY")
+    else:
+        emit("❌ Overall Status: UNHEALTHY")
+
+
+def _render_database_text(result: Dict[str, Any], emit: Callable[[str], None]) -> None:
+    """Write the database health report."""
+    emit(_DATABASE_BANNER)
+    
+    if result['config_valid']:
+        emit("✅ Database configuration valid")
+    
+    error_type = result['error_type']
+    if error_type == 'database':
+        emit(f"❌ Database error: {result['error']}")
+        return
+    if error_type == 'unexpected':
+        emit(f"❌ Unexpected error: {result['error']}")
+        return
+    if error_type == 'connection':
+        emit(f"❌ Database connection failed: {result['error']}")
+        return
+    
+    emit("✅ Database connection successful")
+    
+    # Table statistics
+    tables = result['tables']
+    if tables:
+        emit("\n📋 Table Statistics:")
+        # Joining a list avoids str.join copying a generator first
+        emit("\n".join([
+            f"  • {table}: {count:,} records" for table, count in tables.items()
+        ]))
+    
+    emit(f"\n🔍 Known items: {result['known_items']} hashes")
+
+
+def _render_integrations_text(result: Dict[str, Any], emit: Callable[[str], None]) -> None:
+    """Write the integration health report."""
+    emit(_INTEGRATIONS_BANNER)
+    
+    # OpenAI
+    emit("\n🤖 OpenAI Integration:")
+    openai = result['openai']
+    if openai['ok']:
+        emit("  ✅ OpenAI client initialized successfully")
+        emit("  ℹ️  API key configured and valid format")
+    else:
+        emit(f"  ❌ OpenAI integration failed: {openai['error']}")
+    
+    # Slack
+    emit("\n📱 Slack Integration:")
+    slack = result['slack']
+    if slack['tested']:
+        emit("  🧪 Testing Slack webhook...")
+    if slack['error'] is not None:
+        emit(f"  ❌ Slack integration failed: {slack['error']}")
+    elif slack['tested']:
+        emit("  ✅ Slack webhook test successful" if slack['ok'] else "  ❌ Slack webhook test failed")
+    else:
+        emit("  ✅ Slack client initialized successfully")
+        emit("  ℹ️  Use --test flag to test webhook")
+    
+    # Summary
+    emit(f"\n📊 Integration Summary: {result['success_count']}/{result['total_count']} healthy")
+    if result['healthy']:
+        emit("✅ All integrations healthy")
+    else:
+        emit("⚠️  Some integrations have issues")
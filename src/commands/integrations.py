@@ -3,34 +3,55 @@
 Integrations command endpoints for managing external service connections.
 """
 
+import asyncio
 import logging
+import os
+import re
 from argparse import Namespace
-from typing import List
+from typing import ClassVar, Dict, List
 
-from .base import BaseCommand
+from .base import BaseCommand, buffered_output
+from ._clients import get_openai_client, get_slack_notifier
+from core.cache import cached_probe
 
 logger = logging.getLogger(__name__)
 
+# Shape of an OpenAI secret key, including project-scoped "sk-proj-" keys
+_OPENAI_KEY_PATTERN = re.compile(r'^sk-[A-Za-z0-9_\-]{20,}$')
+
+# Without --deep only the key is checked, so don't report a connection
+_KEY_FORMAT_ONLY = "key format valid (use --deep to test the API)"
+
+
+def _openai_status_label(ok: bool, deep: bool) -> str:
+    """Describe an OpenAI test result according to how deep the test went."""
+    if deep:
+        return '✅ Connected' if ok else '❌ Failed'
+    return f'✅ {_KEY_FORMAT_ONLY}' if ok else '❌ key missing or malformed'
+
 
 class IntegrationsCommand(BaseCommand):
     """Handle external integration operations."""
     
+    # Subcommand -> handler method name
+    _HANDLERS: ClassVar[Dict[str, str]] = {
+        'test': 'test',
+        'slack': 'slack',
+        'openai': 'openai',
+        'status': 'status',
+    }
+    _SUBCOMMANDS = tuple(_HANDLERS)
+    
     def execute(self, subcommand: str, args: Namespace) -> int:
         """Execute integrations subcommand."""
+        handler_name = self._HANDLERS.get(subcommand)
+        if handler_name is None:
+            available = self._available_subcommands_str
+            self.logger.error(f"Unknown subcommand '{subcommand}'. Available: {available}")
+            return self.FAILURE
+        
         try:
-            if subcommand == "test":
-                return self.test(args)
-            elif subcommand == "slack":
-                return self.slack(args)
-            elif subcommand == "openai":
-                return self.openai(args)
-            elif subcommand == "status":
-                return self.status(args)
-            else:
-                available = ", ".join(self.get_available_subcommands())
-                self.logger.error(f"Unknown subcommand '{subcommand}'. Available: {available}")
-                return 1
-                
+            return getattr(self, handler_name)(args)
         except Exception as e:
             return self.handle_error(e, f"integrations {subcommand}")
     
@@ -39,22 +60,21 @@ class IntegrationsCommand(BaseCommand):
         try:
             print("🔍 Testing integrations...")
             
-            # Test OpenAI
-            openai_status = self._test_openai()
-            
-            # Test Slack
-            slack_status = self._test_slack()
+            # Test OpenAI and Slack concurrently
+            openai_status, slack_status = asyncio.run(self._test_all(
+                args.force, args.deep
+            ))
             
             print(f"\n=== Integration Test Results ===")
-            print(f"🤖 OpenAI API: {'✅ Connected' if openai_status else '❌ Failed'}")
+            print(f"🤖 OpenAI API: {_openai_status_label(openai_status, args.deep)}")
             print(f"💬 Slack API: {'✅ Connected' if slack_status else '❌ Failed'}")
             
             if openai_status and slack_status:
-                print("✅ All integrations working")
-                return 0
+                print("✅ All integrations working" if args.deep else "✅ All integrations passed (OpenAI key checked only)")
+                return self.SUCCESS
             else:
                 print("⚠️  Some integrations failed - check configuration")
-                return 1
+                return self.FAILURE
             
         except Exception as e:
             return self.handle_error(e, "integrations test")
@@ -62,7 +82,7 @@ class IntegrationsCommand(BaseCommand):
     def slack(self, args: Namespace) -> int:
         """Test or manage Slack integration."""
         try:
-            action = getattr(args, 'action', 'test')
+            action = args.action
             
             if action == 'test':
                 print("🔍 Testing Slack connection...")
@@ -70,19 +90,19 @@ class IntegrationsCommand(BaseCommand):
                 
                 if success:
                     print("✅ Slack integration working")
-                    return 0
+                    return self.SUCCESS
                 else:
                     print("❌ Slack integration failed")
-                    return 1
+                    return self.FAILURE
                     
             elif action == 'send':
                 # Send a test message
-                message = getattr(args, 'message', 'Test message from newser CLI')
+                message = args.message
                 return self._send_test_slack_message(message)
                 
             else:
                 self.logger.error(f"Unknown slack action '{action}'. Use 'test' or 'send'")
-                return 1
+                return self.FAILURE
             
         except Exception as e:
             return self.handle_error(e, "integrations slack")
@@ -90,27 +110,30 @@ class IntegrationsCommand(BaseCommand):
     def openai(self, args: Namespace) -> int:
         """Test or manage OpenAI integration."""
         try:
-            action = getattr(args, 'action', 'test')
+            action = args.action
             
             if action == 'test':
-                print("🔍 Testing OpenAI connection...")
-                success = self._test_openai()
+                print("🔍 Testing OpenAI connection..." if args.deep else "🔍 Checking OpenAI API key...")
+                success = self._test_openai(deep=args.deep)
                 
-                if success:
+                if success and not args.deep:
+                    print(f"✅ OpenAI {_KEY_FORMAT_ONLY}")
+                    return self.SUCCESS
+                elif success:
                     print("✅ OpenAI integration working")
-                    return 0
+                    return self.SUCCESS
                 else:
                     print("❌ OpenAI integration failed")
-                    return 1
+                    return self.FAILURE
                     
             elif action == 'analyze':
                 # Test analysis with sample text
-                sample_text = getattr(args, 'text', 'זהו טקסט לדוגמה לבדיקת הניתוח העברי')
+                sample_text = args.text
                 return self._test_openai_analysis(sample_text)
                 
             else:
                 self.logger.error(f"Unknown openai action '{action}'. Use 'test' or 'analyze'")
-                return 1
+                return self.FAILURE
             
         except Exception as e:
             return self.handle_error(e, "integrations openai")
@@ -118,46 +141,61 @@ class IntegrationsCommand(BaseCommand):
     def status(self, args: Namespace) -> int:
         """Show status of all integrations."""
         try:
-            print("📊 Integration Status:")
-            
-            # Check environment variables
-            import os
-            
-            openai_key = bool(os.getenv('OPENAI_API_KEY'))
-            slack_token = bool(os.getenv('SLACK_BOT_TOKEN'))
-            slack_channel = bool(os.getenv('SLACK_CHANNEL_ID'))
-            
-            print(f"🔑 Environment Variables:")
-            print(f"   • OPENAI_API_KEY: {'✅ Set' if openai_key else '❌ Missing'}")
-            print(f"   • SLACK_BOT_TOKEN: {'✅ Set' if slack_token else '❌ Missing'}")
-            print(f"   • SLACK_CHANNEL_ID: {'✅ Set' if slack_channel else '❌ Missing'}")
-            
-            # Test connections if keys are available
-            if openai_key or slack_token:
-                print(f"\n🔍 Connection Tests:")
+            with buffered_output() as emit:
+                emit("📊 Integration Status:")
+                
+                # Check environment variables
+                openai_key = bool(os.getenv('OPENAI_API_KEY'))
+                slack_token = bool(os.getenv('SLACK_BOT_TOKEN'))
+                slack_channel = bool(os.getenv('SLACK_CHANNEL_ID'))
                 
-                if openai_key:
-                    openai_status = self._test_openai()
-                    print(f"   • OpenAI API: {'✅ Connected' if openai_status else '❌ Failed'}")
+                emit(f"🔑 Environment Variables:")
+                emit(f"   • OPENAI_API_KEY: {'✅ Set' if openai_key else '❌ Missing'}")
+                emit(f"   • SLACK_BOT_TOKEN: {'✅ Set' if slack_token else '❌ Missing'}")
+                emit(f"   • SLACK_CHANNEL_ID: {'✅ Set' if slack_channel else '❌ Missing'}")
                 
-                if slack_token:
-                    slack_status = self._test_slack()
-                    print(f"   • Slack API: {'✅ Connected' if slack_status else '❌ Failed'}")
+                # Test connections if keys are available
+                if openai_key or slack_token:
+                    emit(f"\n🔍 Connection Tests:")
+                    
+                    force = args.force
+                    if openai_key:
+                        openai_status = self._test_openai(force, args.deep)
+                        emit(f"   • OpenAI API: {_openai_status_label(openai_status, args.deep)}")
+                    
+                    if slack_token:
+                        slack_status = self._test_slack(force)
+                        emit(f"   • Slack API: {'✅ Connected' if slack_status else '❌ Failed'}")
             
-            return 0
+            return self.SUCCESS
             
         except Exception as e:
             return self.handle_error(e, "integrations status")
     
-    def _test_openai(self) -> bool:
-        """Test OpenAI connection."""
+    async def _test_all(self, force: bool = False, deep: bool = False):
+        """Run the OpenAI and Slack connection tests in parallel threads."""
+        return await asyncio.gather(
+            asyncio.to_thread(self._test_openai, force, deep),
+            asyncio.to_thread(self._test_slack, force)
+        )
+    
+    def _test_openai(self, force: bool = False, deep: bool = False) -> bool:
+        """
+        Test the OpenAI integration.
+        
+        By default only the API key format is checked locally. A deep test
+        makes a real analysis call, reusing a recent result unless forced.
+        """
+        if not deep:
+            return bool(_OPENAI_KEY_PATTERN.match(os.getenv('OPENAI_API_KEY', '')))
+        
         try:
-            from integrations.openai_client import OpenAIClient
-            client = OpenAIClient()
+            def probe() -> bool:
+                # Simple test call
+                response = get_openai_client().analyze_text("Test connection", "Simple test for connectivity")
+                return response is not None
             
-            # Simple test call
-            response = client.analyze_text("Test connection", "Simple test for connectivity")
-            return response is not None
+            return cached_probe('openai', probe, force=force)
             
         except ImportError:
             self.logger.warning("OpenAI client not available")
@@ -166,14 +204,11 @@ class IntegrationsCommand(BaseCommand):
             self.logger.warning(f"OpenAI test failed: {e}")
             return False
     
-    def _test_slack(self) -> bool:
-        """Test Slack connection."""
+    def _test_slack(self, force: bool = False) -> bool:
+        """Test Slack connection, reusing a recent result unless forced."""
         try:
-            from core.notifications.channels.slack import SlackNotifier
-            client = SlackNotifier()
-            
             # Test connection (without sending message)
-            return client.test_connection()
+            return cached_probe('slack', lambda: get_slack_notifier().test_connection(), force=force)
             
         except ImportError:
             self.logger.warning("Slack client not available")
@@ -185,38 +220,36 @@ class IntegrationsCommand(BaseCommand):
     def _send_test_slack_message(self, message: str) -> int:
         """Send a test message to Slack."""
         try:
-            from core.notifications.channels.slack import SlackNotifier
-            client = SlackNotifier()
+            client = get_slack_notifier()
             
             success = client.send_simple_message(f"🧪 Test: {message}")
             
             if success:
                 print(f"✅ Test message sent to Slack: {message}")
-                return 0
+                return self.SUCCESS
             else:
                 print("❌ Failed to send test message")
-                return 1
+                return self.FAILURE
                 
         except Exception as e:
             self.logger.error(f"Error sending test message: {e}")
-            return 1
+            return self.FAILURE
     
     def _test_openai_analysis(self, text: str) -> int:
         """Test OpenAI analysis with sample text."""
         try:
-            from integrations.openai_client import OpenAIClient
-            client = OpenAIClient()
+            client = get_openai_client()
             
             print(f"🧠 Testing OpenAI analysis with: {text}")
             response = client.analyze_text("Test analysis", text)
             
             if response:
                 print(f"✅ Analysis result: {response[:200]}...")
-                return 0
+                return self.SUCCESS
             else:
                 print("❌ Analysis returned empty result")
-                return 1
+                return self.FAILURE
                 
         except Exception as e:
             self.logger.error(f"Error in OpenAI analysis test: {e}")
-            return 1
\ No newline at end of file
+            return self.FAILURE
\ No newline at end of file
@@ -5,79 +5,158 @@ News command endpoints for fetching, analyzing, and managing news content.
 
 import logging
 from argparse import Namespace
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import compress
+from typing import Any, ClassVar, Dict, List, Optional
 from datetime import datetime
 
-from .base import BaseCommand
+from .base import BaseCommand, buffered_output
 from core.models.article import Article
 from core.analysis.hebrew.analyzer import HebrewNewsAnalyzer
 from core.models.metrics import RunRecord
-from core.models.analysis import AnalysisRecord
+from core.models.analysis import AnalysisRecord, HebrewAnalysisResult
+from core.formatting import format_article, format_hebrew_analysis
+from core.llm_cache import get_llm_response_cache
+from core.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
+# How long a thematic analysis may be reused for an identical article set
+_ANALYSIS_REUSE_SECONDS = 60 * 60
+
+# Hebrew analysis display strings
+_HEBREW_HEADER = "\n=== חדשות ישראל - {hours} שעות אחרונות ==="
+_HEBREW_GENERATED = "🕐 נוצר ב: {timestamp:%Y-%m-%d %H:%M:%S}"
+_HEBREW_SUMMARY_LINE = "📰 כתבות: {count} | 🎯 מצב: {mode}"
+_HEBREW_MODE_UPDATES = "עדכונים בלבד"
+_HEBREW_MODE_GENERAL = "ניתוח כללי"
+_HEBREW_NO_UPDATES = "📝 אין עדכונים חדשים לתצוגה"
+_HEBREW_ARTICLE_LIST = "\n=== רשימת כתבות ==="
+_HEBREW_NO_ARTICLES = "לא נמצאו כתבות בטווח הזמן המבוקש"
+
+# Runs the independent end-of-run record writes concurrently
+_RECORD_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='news-records')
+
+
+@dataclass(frozen=True, slots=True)
+class NewsFlags:
+    """Option flags for a news command, read once from the parsed arguments."""
+    no_dedupe: bool = False
+    no_analysis: bool = False
+    no_slack: bool = False
+    updates_only: bool = False
+    verbose: bool = False
+    force: bool = False
+    similarity: float = 0.8
+    
+    @classmethod
+    def from_args(cls, args: Namespace) -> 'NewsFlags':
+        """Build flags from parsed arguments, tolerating options a subcommand lacks."""
+        similarity = getattr(args, 'similarity', None)
+        return cls(
+            no_dedupe=getattr(args, 'no_dedupe', False),
+            no_analysis=getattr(args, 'no_analysis', False),
+            no_slack=getattr(args, 'no_slack', False),
+            updates_only=getattr(args, 'updates_only', False),
+            verbose=getattr(args, 'verbose', False),
+            force=getattr(args, 'force', False),
+            similarity=0.8 if similarity is None else similarity
+        )
+
+
+def _format_article_lines(articles: List[Article]) -> str:
+    """
+    Format the article listing shown after a run.
+    
+    Args:
+        articles: Articles to list
+        
+    Returns:
+        One timestamp/source/title line and one link line per article,
+        with a blank line after each article
+    """
+    return "\n".join(map(format_article, articles))
+
+
+def _to_dicts(articles: List[Article], cache: Dict[int, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Convert articles to dicts, reusing conversions already in ``cache``.
+    
+    Args:
+        articles: Articles to convert
+        cache: Article id -> converted dict, filled in as articles are converted
+        
+    Returns:
+        Article dicts in input order
+    """
+    article_dicts = []
+    for article in articles:
+        article_dict = cache.get(id(article))
+        if article_dict is None:
+            article_dict = cache[id(article)] = article.to_dict()
+        article_dicts.append(article_dict)
+    return article_dicts
+
 
 class NewsCommand(BaseCommand):
     """Handle news fetching, analysis, and distribution operations."""
     
+    # Subcommand -> handler method name
+    _HANDLERS: ClassVar[Dict[str, str]] = {
+        'fetch': 'fetch',
+        'analyze': 'analyze',
+        'summary': 'summary',
+    }
+    _SUBCOMMANDS = tuple(_HANDLERS)
+    
     def execute(self, subcommand: str, args: Namespace) -> int:
         """Execute news subcommand."""
+        handler_name = self._HANDLERS.get(subcommand)
+        if handler_name is None:
+            available = self._available_subcommands_str
+            self.logger.error(f"Unknown subcommand '{subcommand}'. Available: {available}")
+            return self.FAILURE
+        
         try:
-            if subcommand == "fetch":
-                return self.fetch(args)
-            elif subcommand == "analyze":
-                return self.analyze(args)
-            elif subcommand == "summary":
-                return self.summary(args)
-            else:
-                available = ", ".join(self.get_available_subcommands())
-                self.logger.error(f"Unknown subcommand '{subcommand}'. Available: {available}")
-                return 1
-                
+            return getattr(self, handler_name)(args)
         except Exception as e:
             return self.handle_error(e, f"news {subcommand}")
     
-    def fetch(self, args: Namespace) -> int:
+    def create_openai_client(self):
+        """Create an OpenAI client that reuses recent identical responses."""
+        client = super().create_openai_client()
+        client.response_cache = get_llm_response_cache()
+        return client
+    
+    def fetch(self, args: Namespace, flags: Optional[NewsFlags] = None) -> int:
         """Fetch news articles from RSS feeds."""
+        if flags is None:
+            flags = NewsFlags.from_args(args)
         run_id = self.data_manager.generate_run_id()
         
         # Start metrics tracking
         self.metrics.start_run(run_id, f"news fetch --hours {args.hours}")
         
         try:
-            # Get components from container
-            security_validator = self.security_validator
-            
             # Fetch articles using new modular source system
             with self.metrics.time_operation("rss_fetch"):
-                articles = self._fetch_from_sources(args)
+                articles = self._fetch_from_sources(args, flags)
                 self.metrics.record_stat("articles_scraped", len(articles))
             
             if not articles:
                 print("No articles found in the specified time range.")
                 self.metrics.end_run(success=True)
-                return 0
+                return self.SUCCESS
             
             # Security validation
             with self.metrics.time_operation("security_validation"):
-                secure_articles = []
-                for article in articles:
-                    if security_validator.validate_url(article.link):
-                        article.title = security_validator.sanitize_title(article.title)
-                        article.summary = security_validator.sanitize_summary(article.summary or "")
-                        secure_articles.append(article)
-                    else:
-                        self.logger.warning(f"Blocked article with invalid URL: {article.link}")
-                
-                articles = secure_articles
+                articles = self._secure_articles(articles)
             
             # Deduplication
-            if not getattr(args, 'no_dedupe', False):
+            if not flags.no_dedupe:
                 with self.metrics.time_operation("deduplication"):
-                    similarity = getattr(args, 'similarity', 0.8)
-                    if similarity is None:
-                        similarity = 0.8
-                    deduplicator = self.create_deduplicator(similarity_threshold=similarity)
+                    deduplicator = self.create_deduplicator(similarity_threshold=flags.similarity)
                     articles = deduplicator.deduplicate(articles)
                     self.metrics.record_stat("articles_after_dedup", len(articles))
             else:
@@ -91,7 +170,6 @@ class NewsCommand(BaseCommand):
             fresh_articles = []
             if stored_count > 0:
                 # Build hash lookup for efficient filtering
-                from core.state_manager import StateManager
                 inserted_hash_set = set(inserted_hashes)
                 
                 for article in articles:
@@ -115,7 +193,9 @@ class NewsCommand(BaseCommand):
             # Hebrew analysis (now default unless --no-analysis flag is used)
             # Only analyze fresh articles, not duplicates
             hebrew_result = None
-            if not getattr(args, 'no_analysis', False) and fresh_articles:
+            # One client serves both analysis and notification, sharing its response cache
+            openai_client = None
+            if not flags.no_analysis and fresh_articles:
                 state_manager = self.state_manager
                 
                 with self.metrics.time_operation("hebrew_analysis"):
@@ -123,10 +203,7 @@ class NewsCommand(BaseCommand):
                         openai_client = self.create_openai_client()
                         hebrew_analyzer = HebrewNewsAnalyzer(state_manager, openai_client)
                         
-                        if getattr(args, 'updates_only', False):
-                            hebrew_result = hebrew_analyzer.analyze_articles_with_novelty(fresh_articles, hours=args.hours)
-                        else:
-                            hebrew_result = hebrew_analyzer.analyze_articles_thematic(fresh_articles, hours=args.hours)
+                        hebrew_result = self._analyze_articles(hebrew_analyzer, fresh_articles, args.hours, flags)
                         
                         self.metrics.record_stat("analysis_completed", True)
                         logger.info("Hebrew analysis completed successfully")
@@ -139,19 +216,21 @@ class NewsCommand(BaseCommand):
             
             # Smart Notification System (new 3-bucket approach) - default enabled unless --no-slack
             # Only send notifications for fresh articles
-            if not getattr(args, 'no_slack', False) and fresh_articles:
+            if not flags.no_slack and fresh_articles:
                 with self.metrics.time_operation("smart_notification"):
+                    # Conversions are shared with the fallback, which summarizes all articles
+                    dict_cache = {}
                     try:
                         from core.notifications.smart_notifier import create_smart_notifier
                         
                         # Create smart notifier
                         smart_notifier = create_smart_notifier(
                             state_manager=self.state_manager,
-                            openai_client=self.create_openai_client()
+                            openai_client=openai_client or self.create_openai_client()
                         )
                         
                         # Convert fresh articles to dicts for processing
-                        article_dicts = [article.to_dict() for article in fresh_articles]
+                        article_dicts = _to_dicts(fresh_articles, dict_cache)
                         
                         # Get Slack client for sending
                         slack_client = self.create_slack_notifier()
@@ -183,7 +262,7 @@ class NewsCommand(BaseCommand):
                         # Fallback to old notification system
                         try:
                             slack_client = self.create_slack_notifier()
-                            article_dicts = [article.to_dict() for article in articles]
+                            article_dicts = _to_dicts(articles, dict_cache)
                             
                             success = slack_client.send_news_summary(
                                 article_dicts, 
@@ -196,8 +275,7 @@ class NewsCommand(BaseCommand):
             
             # Store analysis record if we have results
             if hebrew_result:
-                processing_time = sum(getattr(op, 'duration', 0) for op in getattr(self.metrics, '_current_operations', []) 
-                                    if "analysis" in getattr(op, 'operation', ''))
+                processing_time = self.metrics._op_totals.get('hebrew_analysis', 0.0)
                 
                 analysis_record = AnalysisRecord(
                     run_id=run_id,
@@ -208,52 +286,55 @@ class NewsCommand(BaseCommand):
                     confidence=hebrew_result.confidence,
                     processing_time=processing_time
                 )
-                self.data_manager.store_analysis_record(analysis_record)
+            else:
+                analysis_record = None
             
             # Store run record with metrics
             processing_time = self.metrics.get_total_time() if hasattr(self.metrics, 'get_total_time') else 0
             run_record = RunRecord(
                 run_id=run_id,
-                timestamp=datetime.fromtimestamp(self.metrics._run_start_time),
+                timestamp=self.metrics._run_start_dt,
                 hours_window=args.hours,
                 command_used=f"news fetch --hours {args.hours}",
-                articles_scraped=self.metrics._run_stats.get('articles_scraped', len(articles)),
+                articles_scraped=self.metrics.articles_scraped,
                 after_dedup=len(articles),
                 success=True,
                 processing_time=processing_time
             )
-            self.data_manager.store_run_record(run_record)
+            self._store_records(analysis_record, run_record)
             
             # Display results (now includes Hebrew analysis if available)
             # Show fresh articles in the display
             if hebrew_result:
-                self._display_hebrew_analysis(fresh_articles if fresh_articles else articles, hebrew_result, args)
+                self._display_hebrew_analysis(fresh_articles if fresh_articles else articles, hebrew_result, args, flags)
             else:
                 self._display_articles(fresh_articles if fresh_articles else articles, args.hours)
             
             self.metrics.end_run(success=True)
-            return 0
+            return self.SUCCESS
             
         except Exception as e:
             self.metrics.end_run(success=False)
             raise
     
-    def analyze(self, args: Namespace) -> int:
+    def analyze(self, args: Namespace, flags: Optional[NewsFlags] = None) -> int:
         """Analyze recent articles with Hebrew AI analysis."""
+        if flags is None:
+            flags = NewsFlags.from_args(args)
         run_id = self.data_manager.generate_run_id()
         
         # Start metrics tracking
         command_str = f"news analyze --hours {args.hours}"
-        if getattr(args, 'updates_only', False):
+        if flags.updates_only:
             command_str += " --updates-only"
-        if not getattr(args, 'no_slack', False):
+        if not flags.no_slack:
             command_str += " --slack"
             
         self.metrics.start_run(run_id, command_str)
         
         try:
             # First fetch articles (reuse fetch logic)
-            articles = self._fetch_and_process_articles(args)
+            articles = self._fetch_and_process_articles(args, flags)
             
             # Store articles in database
             stored_count = self.database.store_articles(articles)
@@ -262,7 +343,7 @@ class NewsCommand(BaseCommand):
             if not articles:
                 print("No articles found for analysis.")
                 self.metrics.end_run(success=True)
-                return 0
+                return self.SUCCESS
             
             # Initialize Hebrew analyzer with state manager from container
             state_manager = self.state_manager
@@ -272,10 +353,7 @@ class NewsCommand(BaseCommand):
                     openai_client = self.create_openai_client()
                     hebrew_analyzer = HebrewNewsAnalyzer(state_manager, openai_client)
                     
-                    if getattr(args, 'updates_only', False):
-                        hebrew_result = hebrew_analyzer.analyze_articles_with_novelty(articles, hours=args.hours)
-                    else:
-                        hebrew_result = hebrew_analyzer.analyze_articles_thematic(articles, hours=args.hours)
+                    hebrew_result = self._analyze_articles(hebrew_analyzer, articles, args.hours, flags)
                     
                     self.metrics.record_stat("analysis_completed", True)
                     
@@ -286,7 +364,7 @@ class NewsCommand(BaseCommand):
                     raise RuntimeError(f"LLM analysis is required but failed: {str(e)}") from e
             
             # Send to Slack (default enabled unless --no-slack)
-            if not getattr(args, 'no_slack', False) and hebrew_result:
+            if not flags.no_slack and hebrew_result:
                 with self.metrics.time_operation("slack_notification"):
                     try:
                         slack_client = self.create_slack_notifier()
@@ -309,8 +387,7 @@ class NewsCommand(BaseCommand):
             
             # Store analysis record and final run metrics
             if hebrew_result:
-                processing_time = sum(getattr(op, 'duration', 0) for op in getattr(self.metrics, '_current_operations', []) 
-                                    if "analysis" in getattr(op, 'operation', ''))
+                processing_time = self.metrics._op_totals.get('hebrew_analysis', 0.0)
                 
                 analysis_record = AnalysisRecord(
                     run_id=run_id,
@@ -321,27 +398,28 @@ class NewsCommand(BaseCommand):
                     confidence=hebrew_result.confidence,
                     processing_time=processing_time
                 )
-                self.data_manager.store_analysis_record(analysis_record)
+            else:
+                analysis_record = None
             
             # Store final run record with complete metrics
             total_time = self.metrics.get_total_time() if hasattr(self.metrics, 'get_total_time') else 0
             run_record = RunRecord(
                 run_id=run_id,
-                timestamp=datetime.fromtimestamp(self.metrics._run_start_time),
+                timestamp=self.metrics._run_start_dt,
                 hours_window=args.hours,
                 command_used=command_str,
-                articles_scraped=self.metrics._run_stats.get('articles_scraped', len(articles)),
+                articles_scraped=self.metrics.articles_scraped,
                 after_dedup=len(articles),
                 success=True,
                 processing_time=total_time
             )
-            self.data_manager.store_run_record(run_record)
+            self._store_records(analysis_record, run_record)
             
             # Display results
-            self._display_hebrew_analysis(articles, hebrew_result, args)
+            self._display_hebrew_analysis(articles, hebrew_result, args, flags)
             
             self.metrics.end_run(success=True)
-            return 0
+            return self.SUCCESS
             
         except Exception as e:
             self.metrics.end_run(success=False)
@@ -352,20 +430,20 @@ class NewsCommand(BaseCommand):
         try:
             days = getattr(args, 'days', 3)
             
-            # Get recent runs and analyses
+            # Totals are aggregated by the database; only the recent entries are listed
+            aggregates = self.data_manager.get_run_aggregates(days=days)
             recent_runs = self.data_manager.get_recent_runs(days=days, data_type="articles")
             recent_analyses = self.data_manager.get_recent_runs(days=days, data_type="analyses")
             
             print(f"\n=== News Activity Summary - Last {days} Days ===")
-            print(f"📊 Total Runs: {len(recent_runs)}")
+            print(f"📊 Total Runs: {aggregates['total_runs']}")
             print(f"🧠 Analyses Completed: {len(recent_analyses)}")
             
+            if aggregates['total_runs']:
+                print(f"📰 Total Articles Processed: {aggregates['total_articles']}")
+                print(f"📈 Average Articles per Run: {aggregates['avg_articles']:.1f}")
+            
             if recent_runs:
-                total_articles = sum(run.after_dedup for run in recent_runs)
-                avg_articles = total_articles / len(recent_runs)
-                print(f"📰 Total Articles Processed: {total_articles}")
-                print(f"📈 Average Articles per Run: {avg_articles:.1f}")
-                
                 # Show recent runs
                 print(f"\n=== Recent Runs ===")
                 for run in recent_runs[:5]:  # Show last 5
@@ -380,18 +458,76 @@ class NewsCommand(BaseCommand):
                     conf = f"{analysis.confidence:.1f}" if analysis.confidence else "N/A"
                     print(f"🧠 {timestamp} | {analysis.analysis_type} | confidence: {conf}")
             
-            return 0
+            return self.SUCCESS
             
         except Exception as e:
             return self.handle_error(e, "news summary")
     
-    def _fetch_and_process_articles(self, args: Namespace) -> List[Article]:
-        """Helper method to fetch and process articles."""
-        security_validator = self.security_validator
+    def _analyze_articles(self, hebrew_analyzer: HebrewNewsAnalyzer, articles: List[Article],
+                          hours: int, flags: NewsFlags) -> HebrewAnalysisResult:
+        """
+        Run Hebrew analysis, reusing a recent thematic result for the same articles.
+        
+        Updates-only analysis always runs, since its result depends on the
+        events already known, not just on the articles.
         
+        Args:
+            hebrew_analyzer: Analyzer to run on a cache miss
+            articles: Articles to analyze
+            hours: Time window for context
+            flags: Option flags; ``force`` skips the reuse lookup
+            
+        Returns:
+            Hebrew analysis result
+        """
+        if flags.updates_only:
+            return hebrew_analyzer.analyze_articles_with_novelty(articles, hours=hours)
+        
+        cache = get_llm_response_cache()
+        key = cache.make_key({
+            'analysis': 'thematic',
+            'model': hebrew_analyzer.openai_client.model,
+            'hours': hours,
+            'links': sorted(article.link for article in articles),
+        })
+        if not flags.force:
+            cached = cache.get(key, ttl_seconds=_ANALYSIS_REUSE_SECONDS)
+            if cached is not None:
+                logger.info(f"Reusing thematic analysis of the same {len(articles)} articles")
+                return HebrewAnalysisResult.from_dict(cached)
+        
+        hebrew_result = hebrew_analyzer.analyze_articles_thematic(articles, hours=hours)
+        cache.set(key, hebrew_result.to_dict())
+        return hebrew_result
+    
+    def _store_records(self, analysis_record: Optional[AnalysisRecord], run_record: RunRecord):
+        """
+        Store the analysis and run records, overlapping the two writes.
+        
+        Args:
+            analysis_record: Analysis record, or None when nothing was analyzed
+            run_record: Run record with metrics
+        """
+        if analysis_record is None:
+            self.data_manager.store_run_record(run_record)
+            return
+        
+        futures = [
+            _RECORD_EXECUTOR.submit(self.data_manager.store_analysis_record, analysis_record),
+            _RECORD_EXECUTOR.submit(self.data_manager.store_run_record, run_record),
+        ]
+        
+        # Wait for both writes before surfacing the first failure
+        errors = [future.exception() for future in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+    
+    def _fetch_and_process_articles(self, args: Namespace, flags: NewsFlags) -> List[Article]:
+        """Helper method to fetch and process articles."""
         # Fetch articles using new modular source system
         with self.metrics.time_operation("rss_fetch"):
-            articles = self._fetch_from_sources(args)
+            articles = self._fetch_from_sources(args, flags)
             self.metrics.record_stat("articles_scraped", len(articles))
         
         if not articles:
@@ -399,25 +535,13 @@ class NewsCommand(BaseCommand):
         
         # Security validation
         with self.metrics.time_operation("security_validation"):
-            secure_articles = []
-            for article in articles:
-                if security_validator.validate_url(article.link):
-                    article.title = security_validator.sanitize_title(article.title)
-                    article.summary = security_validator.sanitize_summary(article.summary or "")
-                    secure_articles.append(article)
-                else:
-                    self.logger.warning(f"Blocked article with invalid URL: {article.link}")
-            
-            articles = secure_articles
+            articles = self._secure_articles(articles)
             self.logger.info(f"After security validation: {len(articles)} articles")
         
         # Deduplication
-        if not getattr(args, 'no_dedupe', False):
+        if not flags.no_dedupe:
             with self.metrics.time_operation("deduplication"):
-                similarity = getattr(args, 'similarity', 0.8)
-                if similarity is None:
-                    similarity = 0.8
-                deduplicator = self.create_deduplicator(similarity_threshold=similarity)
+                deduplicator = self.create_deduplicator(similarity_threshold=flags.similarity)
                 articles = deduplicator.deduplicate(articles)
                 self.metrics.record_stat("articles_after_dedup", len(articles))
                 self.logger.info(f"After deduplication: {len(articles)} articles")
@@ -426,57 +550,66 @@ class NewsCommand(BaseCommand):
         
         return articles
     
+    def _secure_articles(self, articles: List[Article]) -> List[Article]:
+        """
+        Drop articles with untrusted URLs and sanitize the rest in place.
+        
+        Args:
+            articles: Freshly fetched articles
+            
+        Returns:
+            Articles that passed URL validation
+        """
+        mask, titles, summaries = self.security_validator.validate_and_sanitize_batch(articles)
+        
+        for article, passed in zip(articles, mask):
+            if not passed:
+                self.logger.warning(f"Blocked article with invalid URL: {article.link}")
+        
+        secure_articles = list(compress(articles, mask))
+        for article, title, summary in zip(secure_articles, titles, summaries):
+            article.title = title
+            article.summary = summary
+        return secure_articles
+    
     def _display_articles(self, articles: List[Article], hours: int):
         """Display articles in a formatted way."""
-        print(f"\n=== Israeli News Headlines - Last {hours} Hours ===")
-        print(f"Generated at: {self.metrics._run_start_time}")
-        print(f"Total articles: {len(articles)}\n")
-        
-        if articles:
-            for article in articles:
-                timestamp = ""
-                if article.published:
-                    timestamp = article.published.strftime("%Y-%m-%d %H:%M")
-                
-                print(f"[{timestamp}] [{article.source.upper()}] {article.title}")
-                print(f"    {article.link}\n")
-        else:
-            print("No articles found in the specified time range.")
+        with buffered_output() as emit:
+            emit(f"\n=== Israeli News Headlines - Last {hours} Hours ===")
+            emit(f"Generated at: {self.metrics._run_start_dt.isoformat(sep=' ', timespec='seconds')}")
+            emit(f"Total articles: {len(articles)}\n")
+            
+            if articles:
+                emit(_format_article_lines(articles))
+            else:
+                emit("No articles found in the specified time range.")
     
-    def _display_hebrew_analysis(self, articles: List[Article], hebrew_result, args: Namespace):
+    def _display_hebrew_analysis(self, articles: List[Article], hebrew_result, args: Namespace, flags: NewsFlags):
         """Display Hebrew analysis results."""
         if not hebrew_result:
             print("Analysis failed - no results to display.")
             return
         
         # Display Hebrew analysis
-        mode_name = "עדכונים בלבד" if getattr(args, 'updates_only', False) else "ניתוח כללי"
-        print(f"\n=== חדשות ישראל - {args.hours} שעות אחרונות ===")
-        print(f"🕐 נוצר ב: {hebrew_result.analysis_timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"📰 כתבות: {len(articles)} | 🎯 מצב: {mode_name}")
-        
-        # Show Hebrew analysis
-        from core.formatting import format_hebrew_analysis
-        print(format_hebrew_analysis(hebrew_result))
-        
-        # In updates-only mode, don't show all articles if no new content
-        if getattr(args, 'updates_only', False) and not hebrew_result.has_new_content:
-            print("📝 אין עדכונים חדשים לתצוגה")
-        elif not getattr(args, 'updates_only', False) or hebrew_result.has_new_content:
-            # Show article list
-            if articles:
-                print(f"\n=== רשימת כתבות ===")
-                for article in articles:
-                    timestamp = ""
-                    if article.published:
-                        timestamp = article.published.strftime("%Y-%m-%d %H:%M")
-                    
-                    print(f"[{timestamp}] [{article.source.upper()}] {article.title}")
-                    print(f"    {article.link}\n")
+        mode_name = _HEBREW_MODE_UPDATES if flags.updates_only else _HEBREW_MODE_GENERAL
+        with buffered_output() as emit:
+            emit(_HEBREW_HEADER.format(hours=args.hours))
+            emit(_HEBREW_GENERATED.format(timestamp=hebrew_result.analysis_timestamp))
+            emit(_HEBREW_SUMMARY_LINE.format(count=len(articles), mode=mode_name))
+            
+            # Show Hebrew analysis
+            emit(format_hebrew_analysis(hebrew_result))
+            
+            # In updates-only mode, don't show all articles if no new content
+            if flags.updates_only and not hebrew_result.has_new_content:
+                emit(_HEBREW_NO_UPDATES)
+            elif articles:
+                emit(_HEBREW_ARTICLE_LIST)
+                emit(_format_article_lines(articles))
             else:
-                print("לא נמצאו כתבות בטווח הזמן המבוקש")
+                emit(_HEBREW_NO_ARTICLES)
     
-    def _fetch_from_sources(self, args):
+    def _fetch_from_sources(self, args, flags: NewsFlags):
         """Fetch articles from selected news sources."""
         from core.sources import get_source, list_available_sources
         
@@ -491,7 +624,7 @@ class NewsCommand(BaseCommand):
         
         for source_name in sources_to_fetch:
             try:
-                if getattr(args, 'verbose', False):
+                if flags.verbose:
                     print(f"📡 Fetching from {source_name}...")
                 
                 # Get source instance
@@ -500,26 +633,21 @@ class NewsCommand(BaseCommand):
                 # Fetch articles 
                 articles = source.fetch_recent_articles(hours=args.hours)
                 
-                if getattr(args, 'verbose', False):
+                if flags.verbose:
                     print(f"  📰 Found {len(articles)} articles from {source_name}")
                 
                 # Convert to legacy Article format for compatibility
-                for article_dict in articles:
-                    article_obj = self._dict_to_article(article_dict)
-                    all_articles.append(article_obj)
+                all_articles.extend(map(self._dict_to_article, articles))
                     
             except Exception as e:
                 self.logger.warning(f"Failed to fetch from {source_name}: {e}")
-                if getattr(args, 'verbose', False):
+                if flags.verbose:
                     print(f"  ❌ Failed to fetch from {source_name}: {e}")
         
         return all_articles
     
     def _dict_to_article(self, article_dict):
         """Convert dictionary format to legacy Article object for compatibility."""
-        from core.models.article import Article
-        from datetime import datetime
-        
         # Handle published date
         published = article_dict.get('published')
         if isinstance(published, str):
@@ -558,11 +686,11 @@ class NewsCommand(BaseCommand):
             
             results = content_service.fetch_pending_content(max_fetch)
             
-            if results['success'] > 0:
-                logger.info(f"Successfully fetched content for {results['success']} articles")
+            if results.success > 0:
+                logger.info(f"Successfully fetched content for {results.success} articles")
             
-            if results['failed'] > 0:
-                logger.warning(f"Failed to fetch content for {results['failed']} articles")
+            if results.failed > 0:
+                logger.warning(f"Failed to fetch content for {results.failed} articles")
                 
         except Exception as e:
             # Don't fail the main pipeline if content fetching fails
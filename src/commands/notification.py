@@ -7,24 +7,79 @@ notification preferences for the news aggregation system.
 """
 
 import logging
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Tuple
 from datetime import datetime, timedelta
 
-from .base import BaseCommand
-from ..core.notifications.channels.slack import SlackNotifier
-from ..integrations.push_notifier import PushNotifier
-from ..integrations.notification_formatter import NotificationFormatter
-from ..core.data_manager import DataManager
+from .base import BaseCommand, buffered_output
+
+# Notifier, formatter and database modules are imported where they are used,
+# so loading this module does not pull in the Slack, push or database clients
+if TYPE_CHECKING:
+    from ..core.data_manager import DataManager
+    from ..integrations.notification_formatter import NotificationFormatter
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True, slots=True)
+class _MockAnalysis:
+    """Analysis stand-in exposing the fields the notification formatter reads."""
+    summary: str = ""
+    key_topics: Tuple[str, ...] = ()
+    bulletins: str = ""
+    confidence: float = 0.8
+    analysis_type: str = "thematic"
+    has_new_content: bool = True
+
+
+# Push styles shown by the comparison and example reports
+_PUSH_STYLES = ('breaking', 'summary', 'minimal')
+
+# Rule printed under each format heading
+_PREVIEW_RULE = "-" * 40
+
+# Example data for the format previews; article ages are relative to now
+_MOCK_ARTICLES = (
+    ({'title': 'פיגוע בירושלים - 3 פצועים', 'source': 'ynet', 'link': 'https://example.com/1'},
+     timedelta(minutes=30)),
+    ({'title': 'ממשלת ישראל מאשרת תקציב ביטחון', 'source': 'walla', 'link': 'https://example.com/2'},
+     timedelta(minutes=45)),
+    ({'title': 'הפגנות בתל אביב נגד הרפורמה', 'source': 'ynet', 'link': 'https://example.com/3'},
+     timedelta(hours=1)),
+)
+
+_MOCK_ANALYSIS = _MockAnalysis(
+    summary="המצב הביטחוני מתדרדר עם פיגועים חדשים בירושלים. הממשלה מגיבה בהגדלת התקציב הביטחוני בעוד המחאות נמשכות.",
+    key_topics=("ביטחון פנים", "תקציב ביטחון", "מחאות"),
+    bulletins="עדכון חם: 3 פצועים בפיגוע ירושלים",
+    confidence=0.85,
+    analysis_type="thematic"
+)
+
+
 class NotificationCommand(BaseCommand):
     """Command for testing and managing notifications."""
     
-    def __init__(self, data_manager: DataManager):
+    # Slack format name -> formatter method that renders its preview
+    _SLACK_PREVIEWERS: ClassVar[Dict[str, str]] = {
+        'compact': 'format_slack_compact',
+        'digest': 'format_slack_digest',
+    }
+    
+    def __init__(self, data_manager: 'DataManager'):
         super().__init__()
         self.data_manager = data_manager
-        self.formatter = NotificationFormatter()
+        self._formatter = None
+        self._test_inputs: Dict[int, Tuple[List[Dict[str, Any]], Any, bool]] = {}
+    
+    @property
+    def formatter(self) -> 'NotificationFormatter':
+        """Notification formatter, created on first use."""
+        if self._formatter is None:
+            from ..integrations.notification_formatter import NotificationFormatter
+            self._formatter = NotificationFormatter()
+        return self._formatter
     
     def get_parser(self, subparsers):
         """Set up argument parser for notification commands."""
@@ -71,12 +126,12 @@ class NotificationCommand(BaseCommand):
                 return self.show_examples(args)
             else:
                 print("❌ Unknown notification action. Use --help for options.")
-                return 1
+                return self.FAILURE
                 
         except Exception as e:
             logger.error(f"Notification command error: {e}")
             print(f"❌ Error: {e}")
-            return 1
+            return self.FAILURE
     
     def test_slack_formats(self, args) -> int:
         """Test different Slack notification formats."""
@@ -84,15 +139,12 @@ class NotificationCommand(BaseCommand):
         
         try:
             # Get recent articles for testing
-            articles = self._get_test_articles(args.hours)
-            hebrew_result = self._get_test_analysis()
-            
-            if not articles:
+            articles, hebrew_result, is_mock = self._resolve_test_inputs(args.hours)
+            if is_mock:
                 print("⚠️  No articles found for testing. Using mock data.")
-                articles = self._get_mock_articles()
-                hebrew_result = self._get_mock_analysis()
             
             # Initialize Slack notifier
+            from ..core.notifications.channels.slack import SlackNotifier
             slack = SlackNotifier()
             
             # Test the specified format
@@ -102,14 +154,6 @@ class NotificationCommand(BaseCommand):
             if success:
                 print(f"✅ {args.format.title()} format sent successfully!")
                 
-                # Show preview of what was sent
-                if args.format == "compact":
-                    preview = slack.formatter.format_slack_compact(articles, hebrew_result)
-                elif args.format == "digest":
-                    preview = slack.formatter.format_slack_digest(articles, hebrew_result)
-                else:
-                    preview = {"text": f"Format: {args.format}"}
-                
                 print(f"\n📋 Preview sent:")
                 print(f"Articles: {len(articles)}")
                 print(f"Format: {args.format}")
@@ -118,13 +162,13 @@ class NotificationCommand(BaseCommand):
                 
             else:
                 print(f"❌ Failed to send {args.format} format")
-                return 1
+                return self.FAILURE
                 
         except Exception as e:
             print(f"❌ Slack test failed: {e}")
-            return 1
+            return self.FAILURE
         
-        return 0
+        return self.SUCCESS
     
     def test_push_formats(self, args) -> int:
         """Test push notification formats."""
@@ -132,13 +176,9 @@ class NotificationCommand(BaseCommand):
         
         try:
             # Get recent articles for testing
-            articles = self._get_test_articles(args.hours)
-            hebrew_result = self._get_test_analysis()
-            
-            if not articles:
+            articles, hebrew_result, is_mock = self._resolve_test_inputs(args.hours)
+            if is_mock:
                 print("⚠️  No articles found for testing. Using mock data.")
-                articles = self._get_mock_articles()
-                hebrew_result = self._get_mock_analysis()
             
             # Show what the push notification would look like
             push_message = self.formatter.format_push_notification(articles, hebrew_result, args.style)
@@ -151,8 +191,9 @@ class NotificationCommand(BaseCommand):
             
             # Test actual sending if configured
             try:
-                push_notifier = PushNotifier(provider=args.provider)
-                if push_notifier._is_configured():
+                from ..integrations.push_notifier import PushNotifier
+                if PushNotifier.is_provider_configured(args.provider):
+                    push_notifier = PushNotifier(provider=args.provider)
                     print(f"\n📤 Sending test notification via {args.provider}...")
                     success = push_notifier.send_test_notification(push_message)
                     if success:
@@ -166,118 +207,160 @@ class NotificationCommand(BaseCommand):
                 
         except Exception as e:
             print(f"❌ Push test failed: {e}")
-            return 1
+            return self.FAILURE
         
-        return 0
+        return self.SUCCESS
     
     def compare_formats(self, args) -> int:
         """Compare different notification formats side by side."""
         print("📊 Comparing notification formats...")
         
         try:
-            articles = self._get_test_articles(args.hours)
-            hebrew_result = self._get_test_analysis()
-            
-            if not articles:
-                articles = self._get_mock_articles()
-                hebrew_result = self._get_mock_analysis()
-            
-            print(f"\n📰 Using {len(articles)} articles for comparison\n")
-            
-            # Push notification formats
-            print("📱 PUSH NOTIFICATION FORMATS")
-            print("=" * 60)
+            articles, hebrew_result, _ = self._resolve_test_inputs(args.hours)
             
-            for style in ['breaking', 'summary', 'minimal']:
-                message = self.formatter.format_push_notification(articles, hebrew_result, style)
-                print(f"\n🔹 {style.upper()} ({len(message)} chars):")
-                print("-" * 40)
-                print(message)
-            
-            # Slack formats preview
-            print(f"\n\n💬 SLACK FORMATS")
-            print("=" * 60)
-            
-            formats = {
-                'compact': 'Compact - Single block with key info',
-                'digest': 'Digest - Structured with metrics',
-                'original': 'Original - Full detailed format'
-            }
-            
-            for format_name, description in formats.items():
-                print(f"\n🔹 {format_name.upper()}: {description}")
-                print("-" * 40)
+            with buffered_output() as emit:
+                emit(f"\n📰 Using {len(articles)} articles for comparison\n")
                 
-                if format_name == 'compact':
-                    preview = self.formatter.format_slack_compact(articles, hebrew_result)
-                elif format_name == 'digest':
-                    preview = self.formatter.format_slack_digest(articles, hebrew_result)
-                else:
-                    preview = {"text": "Original detailed format with full article list"}
+                # Push notification formats
+                emit("📱 PUSH NOTIFICATION FORMATS")
+                emit("=" * 60)
                 
-                # Show key characteristics
-                block_count = len(preview.get('blocks', []))
-                print(f"Blocks: {block_count}")
-                if 'blocks' in preview and preview['blocks']:
-                    first_block = preview['blocks'][0]
-                    if 'text' in first_block:
-                        preview_text = first_block['text'].get('text', '')[:100]
-                        print(f"Preview: {preview_text}...")
-            
-            print(f"\n💡 Recommendations:")
-            print(f"• Push: Use 'breaking' for urgent news, 'summary' for regular updates")
-            print(f"• Slack: Use 'compact' for hourly updates, 'digest' for daily summaries")
+                messages = [
+                    (style, self.formatter.format_push_notification(articles, hebrew_result, style))
+                    for style in _PUSH_STYLES
+                ]
+                emit("\n".join(
+                    f"\n🔹 {style.upper()} ({len(message)} chars):\n{_PREVIEW_RULE}\n{message}"
+                    for style, message in messages
+                ))
+                
+                # Slack formats preview
+                emit(f"\n\n💬 SLACK FORMATS")
+                emit("=" * 60)
+                
+                formats = {
+                    'compact': 'Compact - Single block with key info',
+                    'digest': 'Digest - Structured with metrics',
+                    'original': 'Original - Full detailed format'
+                }
+                
+                for format_name, description in formats.items():
+                    emit(f"\n🔹 {format_name.upper()}: {description}")
+                    emit(_PREVIEW_RULE)
+                    
+                    preview = self._slack_preview(
+                        self.formatter, format_name, articles, hebrew_result,
+                        default={"text": "Original detailed format with full article list"}
+                    )
+                    
+                    # Show key characteristics
+                    block_count = len(preview.get('blocks', []))
+                    emit(f"Blocks: {block_count}")
+                    if 'blocks' in preview and preview['blocks']:
+                        first_block = preview['blocks'][0]
+                        if 'text' in first_block:
+                            preview_text = first_block['text'].get('text', '')[:100]
+                            emit(f"Preview: {preview_text}...")
+                
+                emit(f"\n💡 Recommendations:")
+                emit(f"• Push: Use 'breaking' for urgent news, 'summary' for regular updates")
+                emit(f"• Slack: Use 'compact' for hourly updates, 'digest' for daily summaries")
             
         except Exception as e:
             print(f"❌ Comparison failed: {e}")
-            return 1
+            return self.FAILURE
         
-        return 0
+        return self.SUCCESS
     
     def show_examples(self, args) -> int:
         """Show example notifications."""
-        print("📚 Notification Format Examples")
-        
-        # Mock data for examples
-        mock_articles = self._get_mock_articles()
-        mock_analysis = self._get_mock_analysis()
-        
-        if args.type in ['push', 'all']:
-            print(f"\n📱 PUSH NOTIFICATION EXAMPLES")
-            print("=" * 50)
+        with buffered_output() as emit:
+            emit("📚 Notification Format Examples")
             
-            styles = ['breaking', 'summary', 'minimal']
-            for style in styles:
-                message = self.formatter.format_push_notification(mock_articles, mock_analysis, style)
-                print(f"\n🔹 {style.upper()} Style:")
-                print(f"   {message}")
-                print(f"   Length: {len(message)} chars")
-        
-        if args.type in ['slack', 'all']:
-            print(f"\n💬 SLACK FORMAT EXAMPLES")
-            print("=" * 50)
+            # Mock data for examples
+            mock_articles = self._get_mock_articles()
+            mock_analysis = self._get_mock_analysis()
             
-            print(f"\n🔹 COMPACT Format:")
-            print("   • Single block with summary")
-            print("   • Top 3 headlines")
-            print("   • Action buttons if >3 articles")
-            print("   • Best for: Hourly updates")
+            if args.type in ['push', 'all']:
+                emit(f"\n📱 PUSH NOTIFICATION EXAMPLES")
+                emit("=" * 50)
+                
+                for style in _PUSH_STYLES:
+                    message = self.formatter.format_push_notification(mock_articles, mock_analysis, style)
+                    emit(f"\n🔹 {style.upper()} Style:")
+                    emit(f"   {message}")
+                    emit(f"   Length: {len(message)} chars")
             
-            print(f"\n🔹 DIGEST Format:")
-            print("   • Structured header with metrics")
-            print("   • Confidence/urgency/impact bars")
-            print("   • Key insights")
-            print("   • Multiple action buttons")
-            print("   • Best for: Daily summaries")
+            if args.type in ['slack', 'all']:
+                emit(f"\n💬 SLACK FORMAT EXAMPLES")
+                emit("=" * 50)
+                
+                emit(f"\n🔹 COMPACT Format:")
+                emit("   • Single block with summary")
+                emit("   • Top 3 headlines")
+                emit("   • Action buttons if >3 articles")
+                emit("   • Best for: Hourly updates")
+                
+                emit(f"\n🔹 DIGEST Format:")
+                emit("   • Structured header with metrics")
+                emit("   • Confidence/urgency/impact bars")
+                emit("   • Key insights")
+                emit("   • Multiple action buttons")
+                emit("   • Best for: Daily summaries")
+                
+                emit(f"\n🔹 THREAD Format:")
+                emit("   • Main message with overview")
+                emit("   • Separate thread replies for details")
+                emit("   • Analysis in thread")
+                emit("   • Article list in thread")
+                emit("   • Best for: Detailed discussions")
+        
+        return self.SUCCESS
+    
+    def _slack_preview(self, formatter: 'NotificationFormatter', format_name: str,
+                       articles: List[Dict[str, Any]], hebrew_result,
+                       default: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Render the Slack preview for a format.
+        
+        Args:
+            formatter: Formatter to render with
+            format_name: Slack format style
+            articles: Articles to include
+            hebrew_result: Analysis to include (optional)
+            default: Preview for formats without a dedicated formatter method
             
-            print(f"\n🔹 THREAD Format:")
-            print("   • Main message with overview")
-            print("   • Separate thread replies for details")
-            print("   • Analysis in thread")
-            print("   • Article list in thread")
-            print("   • Best for: Detailed discussions")
+        Returns:
+            Slack message payload
+        """
+        method_name = self._SLACK_PREVIEWERS.get(format_name)
+        if method_name is None:
+            return default
+        return getattr(formatter, method_name)(articles, hebrew_result)
+    
+    def _resolve_test_inputs(self, hours: int) -> Tuple[List[Dict[str, Any]], Any, bool]:
+        """
+        Get the articles and analysis to test notifications with.
         
-        return 0
+        Recent articles from the database are used when there are any,
+        otherwise the mock data. Results are kept per ``hours`` so running
+        several actions on one command instance queries the database once.
+        
+        Args:
+            hours: Hours of news to fetch
+            
+        Returns:
+            Tuple of (articles, analysis, whether the mock data was used)
+        """
+        inputs = self._test_inputs.get(hours)
+        if inputs is None:
+            articles = self._get_test_articles(hours)
+            if articles:
+                inputs = (articles, self._get_test_analysis(), False)
+            else:
+                inputs = (self._get_mock_articles(), self._get_mock_analysis(), True)
+            self._test_inputs[hours] = inputs
+        return inputs
     
     def _get_test_articles(self, hours: int) -> List[Dict[str, Any]]:
         """Get recent articles for testing."""
@@ -293,52 +376,23 @@ class NotificationCommand(BaseCommand):
             analyses = self.data_manager.get_recent_analyses(hours=24)
             if analyses:
                 # Convert dict to object-like structure
-                class MockAnalysis:
-                    def __init__(self, data):
-                        self.summary = data.get('summary', '')
-                        self.key_topics = data.get('key_topics', [])
-                        self.bulletins = data.get('bulletins', '')
-                        self.confidence = data.get('confidence', 0.8)
-                        self.analysis_type = data.get('analysis_type', 'thematic')
-                        self.has_new_content = True
-                
-                return MockAnalysis(analyses[0])
+                data = analyses[0]
+                return _MockAnalysis(
+                    summary=data.get('summary', ''),
+                    key_topics=tuple(data.get('key_topics') or ()),
+                    bulletins=data.get('bulletins', ''),
+                    confidence=data.get('confidence', 0.8),
+                    analysis_type=data.get('analysis_type', 'thematic')
+                )
         except Exception:
             pass
         return None
     
     def _get_mock_articles(self) -> List[Dict[str, Any]]:
         """Get mock articles for testing."""
-        return [
-            {
-                'title': 'פיגוע בירושלים - 3 פצועים',
-                'source': 'ynet',
-                'link': 'https://example.com/1',
-                'published': datetime.now() - timedelta(minutes=30)
-            },
-            {
-                'title': 'ממשלת ישראל מאשרת תקציב ביטחון',
-                'source': 'walla',
-                'link': 'https://example.com/2',
-                'published': datetime.now() - timedelta(minutes=45)
-            },
-            {
-                'title': 'הפגנות בתל אביב נגד הרפורמה',
-                'source': 'ynet',
-                'link': 'https://example.com/3',
-                'published': datetime.now() - timedelta(hours=1)
-            }
-        ]
+        now = datetime.now()
+        return [{**article, 'published': now - age} for article, age in _MOCK_ARTICLES]
     
     def _get_mock_analysis(self):
         """Get mock analysis for testing."""
-        class MockAnalysis:
-            def __init__(self):
-                self.summary = "המצב הביטחוני מתדרדר עם פיגועים חדשים בירושלים. הממשלה מגיבה בהגדלת התקציב הביטחוני בעוד המחאות נמשכות."
-                self.key_topics = ["ביטחון פנים", "תקציב ביטחון", "מחאות"]
-                self.bulletins = "עדכון חם: 3 פצועים בפיגוע ירושלים"
-                self.confidence = 0.85
-                self.analysis_type = "thematic"
-                self.has_new_content = True
-        
-        return MockAnalysis()
+        return _MOCK_ANALYSIS
@@ -7,7 +7,7 @@ import logging
 from argparse import Namespace
 from typing import List
 
-from .base import BaseCommand
+from .base import BaseCommand, buffered_output
 from core.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
@@ -16,6 +16,8 @@ logger = logging.getLogger(__name__)
 class StateCommand(BaseCommand):
     """Handle state management operations."""
     
+    _SUBCOMMANDS = ('stats', 'cleanup', 'reset')
+    
     def execute(self, subcommand: str, args: Namespace) -> int:
         """Execute state subcommand."""
         try:
@@ -26,9 +28,9 @@ class StateCommand(BaseCommand):
             elif subcommand == "reset":
                 return self.reset(args)
             else:
-                available = ", ".join(self.get_available_subcommands())
+                available = self._available_subcommands_str
                 self.logger.error(f"Unknown subcommand '{subcommand}'. Available: {available}")
-                return 1
+                return self.FAILURE
                 
         except Exception as e:
             return self.handle_error(e, f"state {subcommand}")
@@ -41,26 +43,22 @@ class StateCommand(BaseCommand):
             # Get state statistics
             stats = state_manager.get_stats()
             
-            print(f"\n=== State Statistics ===")
-            print(f"📊 Database connection: {'✅ Connected' if stats.get('database_healthy') else '❌ Disconnected'}")
-            print(f"📊 Total known events: {stats['total_events']}")
-            
-            if stats.get('oldest_event_date'):
-                print(f"🕐 Oldest event: {stats['oldest_event_date']}")
-            if stats.get('newest_update_date'):
-                print(f"🕐 Newest event: {stats['newest_update_date']}")
+            with buffered_output() as emit:
+                emit(f"\n=== State Statistics ===")
+                emit(f"📊 Database connection: {'✅ Connected' if stats.get('database_connected') else '❌ Disconnected'}")
+                emit(f"📊 Database status: {stats['database_status']}")
+                emit(f"📊 Total known items: {stats['total_known_items']}")
+                emit(f"🧹 Cleanup threshold: {stats['cleanup_threshold_days']} days")
                 
-            if stats.get('events_by_source'):
-                print(f"📈 Events by source:")
-                for source, count in stats['events_by_source'].items():
-                    print(f"  • {source}: {count}")
+                if stats.get('last_checked'):
+                    emit(f"🕐 Checked at: {stats['last_checked']}")
+                if stats.get('error'):
+                    emit(f"❌ Error: {stats['error']}")
             
-            if stats['recent_events']:
-                print(f"\n=== Recent Events (Last 10) ===")
-                for event in stats['recent_events']:
-                    print(f"[{event.timestamp.strftime('%m-%d %H:%M')}] {event.source}: {event.title[:60]}...")
+            if stats.get('error'):
+                return self.FAILURE
             
-            return 0
+            return self.SUCCESS
             
         except Exception as e:
             return self.handle_error(e, "state stats")
@@ -73,21 +71,14 @@ class StateCommand(BaseCommand):
             
             print(f"🧹 Cleaning up events older than {days} days...")
             
-            # Get stats before cleanup
-            before_stats = state_manager.get_stats()
-            
-            # Perform cleanup
-            removed_count = state_manager.cleanup_old_events(days=days)
-            
-            # Get stats after cleanup
-            after_stats = state_manager.get_stats()
+            before_count, removed_count, after_count = state_manager.cleanup_with_counts(days)
             
             print(f"✅ Cleanup completed:")
             print(f"   • Removed: {removed_count} events")
-            print(f"   • Before: {before_stats['total_events']} events")
-            print(f"   • After: {after_stats['total_events']} events")
+            print(f"   • Before: {before_count} events")
+            print(f"   • After: {after_count} events")
             
-            return 0
+            return self.SUCCESS
             
         except Exception as e:
             return self.handle_error(e, "state cleanup")
@@ -101,21 +92,17 @@ class StateCommand(BaseCommand):
                 confirm = input("Are you sure? (yes/no): ").lower().strip()
                 if confirm != 'yes':
                     print("❌ Reset cancelled")
-                    return 0
+                    return self.SUCCESS
             
             state_manager = StateManager()
             
-            # Get stats before reset
-            before_stats = state_manager.get_stats()
-            
-            # Reset state
-            state_manager.reset_state()
+            removed_count = state_manager.reset_state()
             
             print(f"✅ State reset completed:")
-            print(f"   • Removed: {before_stats['total_events']} events")
+            print(f"   • Removed: {removed_count} events")
             print(f"   • Database: cleared")
             
-            return 0
+            return self.SUCCESS
             
         except Exception as e:
             return self.handle_error(e, "state reset")
\ No newline at end of file
@@ -7,9 +7,9 @@ Provides unified interface to different database backends and connection methods
 
 from .supabase_api import SupabaseApiAdapter, SupabaseApiError
 from .legacy_adapter import DatabaseAdapter
-from .connection import get_database, close_database, reset_database_connection
+from .connection import get_database, get_database_async, close_database, reset_database_connection
 
 __all__ = [
     'SupabaseApiAdapter', 'SupabaseApiError', 'DatabaseAdapter',
-    'get_database', 'close_database', 'reset_database_connection'
+    'get_database', 'get_database_async', 'close_database', 'reset_database_connection'
 ]
\ No newline at end of file
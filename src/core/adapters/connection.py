@@ -5,9 +5,13 @@ Unified database connection management.
 Provides single entry point for database connections with automatic fallback logic.
 """
 
+import asyncio
 import logging
 import os
-from typing import Optional, Union
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Optional, Union
 
 from ..database import DatabaseError
 from .supabase_api import SupabaseApiAdapter, SupabaseApiError
@@ -17,6 +21,62 @@ logger = logging.getLogger(__name__)
 
 # Global database instance
 _db_instance = None
+_db_lock = threading.Lock()
+
+# Seconds to wait for a direct PostgreSQL connection
+_DIRECT_CONNECT_TIMEOUT = 10
+
+
+@dataclass(frozen=True)
+class AdapterConfig:
+    """Environment settings that decide which database adapter to use."""
+    is_ci: bool
+    force_direct: bool
+
+
+@lru_cache(maxsize=1)
+def _get_adapter_config() -> AdapterConfig:
+    """Read the adapter settings from the environment once."""
+    return AdapterConfig(
+        is_ci=bool(os.getenv('CI') or os.getenv('GITHUB_ACTIONS')),
+        force_direct=os.getenv('USE_DIRECT_CONNECTION') == 'true'
+    )
+
+
+def _call_with_timeout(func: Callable[[], Any], timeout: float) -> Any:
+    """
+    Run a blocking call on a daemon thread and wait at most ``timeout`` seconds.
+    
+    Unlike SIGALRM this works off the main thread. A call that times out
+    keeps running in the background but cannot delay interpreter exit.
+    
+    Raises:
+        TimeoutError: If the call does not finish in time
+    """
+    outcome = {}
+    
+    def target():
+        try:
+            outcome['result'] = func()
+        except BaseException as e:  # noqa: BLE001 - re-raised in the caller
+            outcome['error'] = e
+    
+    worker = threading.Thread(target=target, name='db-connect', daemon=True)
+    worker.start()
+    worker.join(timeout)
+    
+    if worker.is_alive():
+        raise TimeoutError("Database connection timed out")
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
+
+
+def _connect_direct() -> DatabaseAdapter:
+    """Open a direct PostgreSQL adapter and verify it answers."""
+    adapter = DatabaseAdapter()
+    adapter.health_check(full=False)  # Test connection
+    return adapter
 
 
 def get_database() -> Union[SupabaseApiAdapter, DatabaseAdapter]:
@@ -37,18 +97,43 @@ def get_database() -> Union[SupabaseApiAdapter, DatabaseAdapter]:
     if _db_instance is not None:
         return _db_instance
     
-    # Check environment
-    is_ci = os.getenv('CI') or os.getenv('GITHUB_ACTIONS')
-    force_direct = os.getenv('USE_DIRECT_CONNECTION') == 'true'
+    with _db_lock:
+        # Another thread may have connected while we waited for the lock
+        if _db_instance is None:
+            _db_instance = _connect()
+        return _db_instance
+
+
+async def get_database_async() -> Union[SupabaseApiAdapter, DatabaseAdapter]:
+    """
+    Get the database connection without blocking the event loop.
+    
+    Returns the cached adapter directly; on first use the connection is set
+    up on a worker thread, with the same priority and fallback rules as
+    ``get_database``.
+    
+    Returns:
+        Database adapter instance
+        
+    Raises:
+        DatabaseError: If no connection method succeeds
+    """
+    if _db_instance is not None:
+        return _db_instance
+    return await asyncio.to_thread(get_database)
+
+
+def _connect() -> Union[SupabaseApiAdapter, DatabaseAdapter]:
+    """Create a database adapter, trying each connection method in turn."""
+    config = _get_adapter_config()
     
     # Try Supabase API first (preferred)
-    if not force_direct:
+    if not config.force_direct:
         try:
             logger.info("Using Supabase REST API (preferred mode)")
-            _db_instance = SupabaseApiAdapter()
-            return _db_instance
+            return SupabaseApiAdapter()
         except Exception as api_error:
-            if is_ci:
+            if config.is_ci:
                 # In CI, don't fallback to direct connection
                 logger.error(f"API connection failed in CI: {api_error}")
                 raise DatabaseError(f"Database API connection failed: {api_error}")
@@ -56,25 +141,12 @@ def get_database() -> Union[SupabaseApiAdapter, DatabaseAdapter]:
                 logger.warning(f"API adapter failed: {api_error}")
     
     # Try direct PostgreSQL connection (only if requested or API failed in dev)
-    if force_direct or not is_ci:
+    if config.force_direct or not config.is_ci:
         try:
             logger.info("Attempting direct PostgreSQL connection")
-            import signal
-            
-            def timeout_handler(signum, frame):
-                raise TimeoutError("Database connection timed out")
-            
-            # Set timeout for connection attempt
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(10)
-            
-            try:
-                _db_instance = DatabaseAdapter()
-                _db_instance.health_check()  # Test connection
-                logger.info("Using direct PostgreSQL connection")
-                return _db_instance
-            finally:
-                signal.alarm(0)  # Clear timeout
+            adapter = _call_with_timeout(_connect_direct, _DIRECT_CONNECT_TIMEOUT)
+            logger.info("Using direct PostgreSQL connection")
+            return adapter
                 
         except Exception as direct_error:
             logger.error(f"Direct connection failed: {direct_error}")
@@ -95,4 +167,5 @@ def close_database():
 def reset_database_connection():
     """Force reset of database connection (useful for testing)."""
     close_database()
+    _get_adapter_config.cache_clear()
     # Next call to get_database() will create new connection
\ No newline at end of file
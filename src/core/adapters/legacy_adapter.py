@@ -66,17 +66,29 @@ class DatabaseAdapter:
         """Update known items with current timestamp."""
         return self._facade.update_known_items(item_hashes, item_type)
     
+    def cleanup_known_items_with_counts(self, days: int = 30):
+        """Remove old known items, returning (before, deleted, after) counts."""
+        return self._facade.cleanup_known_items_with_counts(days)
+    
+    def reset_known_items(self):
+        """Remove all known items, returning how many were deleted."""
+        return self._facade.reset_known_items()
+    
     def store_run_metrics(self, run_id: str, command: str, metrics):
         """Store run metrics in database."""
         return self._facade.store_run_metrics(run_id, command, metrics)
     
+    def get_run_aggregates(self, days: int = 7):
+        """Get run count and article totals for the last N days."""
+        return self._facade.get_run_aggregates(days)
+    
     def cleanup_old_records(self):
         """Clean up old records."""
         return self._facade.cleanup_old_records()
     
-    def health_check(self):
+    def health_check(self, full: bool = True):
         """Check database connection and return status info."""
-        return self._facade.health_check()
+        return self._facade.health_check(full)
     
     def emergency_cleanup(self, max_records_per_table: int = 1000):
         """Emergency cleanup if database gets too large."""
@@ -138,7 +150,7 @@ def get_database():
                 
                 try:
                     _db_adapter = DatabaseAdapter()
-                    _db_adapter.health_check()
+                    _db_adapter.health_check(full=False)
                     logger.info("Using direct PostgreSQL connection")
                 finally:
                     signal.alarm(0)  # Disable timeout
@@ -219,6 +219,47 @@ class SupabaseApiAdapter:
             logger.error(f"Failed to update known items via API: {e}")
             raise SupabaseApiError(f"Failed to update known items: {e}")
     
+    def cleanup_known_items_with_counts(self, days: int = 30) -> Tuple[int, int, int]:
+        """
+        Remove old known items using API, returning (before, deleted, after).
+        
+        The delete returns the removed rows, so only one more request is
+        needed to count what is left.
+        """
+        try:
+            cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+            
+            deleted = (self.client.table('known_items')
+                      .delete()
+                      .lt('last_seen', cutoff)
+                      .execute())
+            remaining = (self.client.table('known_items')
+                        .select('id', count='exact')
+                        .limit(1)
+                        .execute())
+            
+            deleted_count = len(deleted.data or [])
+            after_count = remaining.count or 0
+            return after_count + deleted_count, deleted_count, after_count
+            
+        except Exception as e:
+            logger.error(f"Failed to cleanup known items via API: {e}")
+            raise SupabaseApiError(f"Failed to cleanup known items: {e}")
+    
+    def reset_known_items(self) -> int:
+        """Remove all known items using API, returning how many were deleted."""
+        try:
+            # PostgREST refuses an unfiltered delete, so match every row
+            result = (self.client.table('known_items')
+                     .delete()
+                     .neq('item_hash', '')
+                     .execute())
+            return len(result.data or [])
+            
+        except Exception as e:
+            logger.error(f"Failed to reset known items via API: {e}")
+            raise SupabaseApiError(f"Failed to reset known items: {e}")
+    
     # Analysis Operations
     
     def store_analysis(self, run_id: str, analysis_result) -> int:
@@ -294,6 +335,27 @@ class SupabaseApiAdapter:
             logger.error(f"Failed to store run metrics via API: {e}")
             raise SupabaseApiError(f"Failed to store run metrics: {e}")
     
+    def get_run_aggregates(self, days: int = 7) -> Dict[str, Any]:
+        """Get run count and article totals using API."""
+        try:
+            from_time = (datetime.now(timezone.utc).replace(microsecond=0) - 
+                        timedelta(days=days)).isoformat()
+            
+            # Totals are aggregated server-side into a single row
+            # (database/migrations/003_run_aggregates.sql)
+            result = self.client.rpc('run_aggregates', {'since': from_time}).execute()
+            
+            row = result.data[0] if result.data else {}
+            return {
+                'total_runs': row.get('total_runs') or 0,
+                'total_articles': row.get('total_articles') or 0,
+                'avg_articles': float(row.get('avg_articles') or 0.0)
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to get run aggregates via API: {e}")
+            raise SupabaseApiError(f"Failed to get run aggregates: {e}")
+    
     # Cleanup Operations
     
     def cleanup_old_records(self) -> int:
@@ -317,8 +379,17 @@ class SupabaseApiAdapter:
     
     # Health Check
     
-    def health_check(self) -> Dict[str, Any]:
-        """Check API connection health."""
+    def health_check(self, full: bool = True) -> Dict[str, Any]:
+        """
+        Check API connection health.
+        
+        Args:
+            full: Also count rows per table; when False only a single-row
+                query is made to confirm the API is reachable
+            
+        Returns:
+            Health status information
+        """
         try:
             # Test connection with simple query
             result = (self.client.table('articles')
@@ -326,6 +397,13 @@ class SupabaseApiAdapter:
                      .limit(1)
                      .execute())
             
+            if not full:
+                return {
+                    'connected': True,
+                    'method': 'REST API',
+                    'timestamp': datetime.now(timezone.utc).isoformat()
+                }
+            
             # Get table counts
             tables = {}
             for table in ['articles', 'analyses', 'known_items', 'run_metrics']:
@@ -291,6 +291,10 @@ class InMemoryCache:
 _rss_cache: Optional[InMemoryCache] = None
 _analysis_cache: Optional[InMemoryCache] = None
 _general_cache: Optional[InMemoryCache] = None
+_probe_cache: Optional[InMemoryCache] = None
+
+# Health probe results are reused briefly so bursts of checks don't reconnect
+PROBE_TTL_SECONDS = 5
 
 
 def get_rss_cache() -> InMemoryCache:
@@ -329,9 +333,47 @@ def get_general_cache() -> InMemoryCache:
     return _general_cache
 
 
+def cached_probe(name: str, probe: Callable[[], Any], force: bool = False,
+                 succeeded: Callable[[Any], bool] = bool) -> Any:
+    """
+    Run a health probe, reusing a successful result for PROBE_TTL_SECONDS.
+    
+    Failed probes - ones that raise, or whose result ``succeeded`` rejects -
+    are not cached, so the next check runs the probe again.
+    
+    Args:
+        name: Probe name used as the cache key
+        probe: Zero-argument callable performing the check
+        force: Discard any cached result and run the probe
+        succeeded: Tells whether a probe result is worth caching
+        
+    Returns:
+        Probe result
+    """
+    global _probe_cache
+    if _probe_cache is None:
+        _probe_cache = InMemoryCache(
+            default_ttl=PROBE_TTL_SECONDS,
+            max_entries=16,
+            cleanup_interval=60
+        )
+    
+    if force:
+        _probe_cache.delete(name)
+    else:
+        cached = _probe_cache.get(name)
+        if cached is not None:
+            return cached
+    
+    result = probe()
+    if succeeded(result):
+        _probe_cache.set(name, result)
+    return result
+
+
 def clear_all_caches() -> None:
     """Clear all cache instances."""
-    for cache in [_rss_cache, _analysis_cache, _general_cache]:
+    for cache in [_rss_cache, _analysis_cache, _general_cache, _probe_cache]:
         if cache:
             cache.clear()
     logger.info("Cleared all cache instances")
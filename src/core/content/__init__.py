@@ -3,6 +3,6 @@ Content fetching and processing module.
 """
 
 from .fetcher import ContentFetcher
-from .service import ContentService
+from .service import ContentService, FetchResult
 
-__all__ = ['ContentFetcher', 'ContentService']
+__all__ = ['ContentFetcher', 'ContentService', 'FetchResult']
@@ -3,7 +3,7 @@ Content service for managing full-text article fetching and storage.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, NamedTuple, Optional
 from datetime import datetime, timezone
 import json
 
@@ -13,6 +13,13 @@ from ..adapters.supabase_api import SupabaseApiAdapter
 logger = logging.getLogger(__name__)
 
 
+class FetchResult(NamedTuple):
+    """Per-status article counts from a content fetch run."""
+    success: int
+    failed: int
+    skipped: int
+
+
 class ContentService:
     """Service for fetching and storing full article content."""
     
@@ -80,7 +87,7 @@ class ContentService:
         except Exception as e:
             logger.error(f"Failed to update article {article_id}: {e}")
     
-    def fetch_content_for_articles(self, articles: List[Dict[str, Any]]) -> Dict[str, int]:
+    def fetch_content_for_articles(self, articles: List[Dict[str, Any]]) -> FetchResult:
         """
         Fetch full content for a list of articles.
         
@@ -88,9 +95,9 @@ class ContentService:
             articles: List of article dictionaries
             
         Returns:
-            Dictionary with success/failure counts
+            Success/failure/skipped counts
         """
-        results = {'success': 0, 'failed': 0, 'skipped': 0}
+        success = failed = skipped = 0
         
         for article in articles:
             article_id = article['id']
@@ -100,7 +107,7 @@ class ContentService:
             # Skip non-supported sources for now
             if source.lower() not in ['ynet', 'walla']:
                 logger.debug(f"Skipping unsupported source: {source}")
-                results['skipped'] += 1
+                skipped += 1
                 continue
             
             logger.info(f"Fetching content for article {article_id}: {url}")
@@ -112,28 +119,28 @@ class ContentService:
                 if content_data and content_data.get('text'):
                     # Store successful content
                     self.update_article_content(article_id, content_data, 'fetched')
-                    results['success'] += 1
+                    success += 1
                     
                     logger.info(f"Successfully fetched content for article {article_id} "
                               f"({len(content_data['text'])} chars)")
                 else:
                     # Mark as failed
                     self.update_article_content(article_id, {}, 'failed')
-                    results['failed'] += 1
+                    failed += 1
                     
                     logger.warning(f"Failed to extract content from {url}")
                     
             except Exception as e:
                 logger.error(f"Error fetching content for article {article_id}: {e}")
                 self.update_article_content(article_id, {}, 'failed')
-                results['failed'] += 1
+                failed += 1
         
-        logger.info(f"Content fetch completed: {results['success']} success, "
-                   f"{results['failed']} failed, {results['skipped']} skipped")
+        logger.info(f"Content fetch completed: {success} success, "
+                   f"{failed} failed, {skipped} skipped")
         
-        return results
+        return FetchResult(success, failed, skipped)
     
-    def fetch_pending_content(self, max_articles: int = 15) -> Dict[str, int]:
+    def fetch_pending_content(self, max_articles: int = 15) -> FetchResult:
         """
         Fetch content for articles with pending status.
         
@@ -141,13 +148,13 @@ class ContentService:
             max_articles: Maximum number of articles to process
             
         Returns:
-            Dictionary with processing results
+            Success/failure/skipped counts
         """
         articles = self.get_articles_needing_content(max_articles)
         
         if not articles:
             logger.info("No articles need content fetching")
-            return {'success': 0, 'failed': 0, 'skipped': 0}
+            return FetchResult(0, 0, 0)
         
         return self.fetch_content_for_articles(articles)
     
@@ -13,6 +13,7 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
 from .database_connection import get_database, DatabaseError
+from .adapters.supabase_api import SupabaseApiError
 from .models.metrics import RunRecord
 from .models.analysis import AnalysisRecord
 
@@ -69,7 +70,22 @@ class DataManager:
             raise
             
     
-    def get_recent_runs(self, days: int = 3) -> List[Dict[str, Any]]:
+    def get_run_aggregates(self, days: int = 3) -> Dict[str, Any]:
+        """
+        Get run count and article totals from the last N days.
+        
+        Failures on either adapter, including a missing run_aggregates()
+        function (database/migrations/003_run_aggregates.sql), are logged
+        and reported as zero totals.
+        """
+        try:
+            return self.db.get_run_aggregates(days)
+            
+        except (DatabaseError, SupabaseApiError) as e:
+            logger.error(f"Failed to get run aggregates: {e}")
+            return {'total_runs': 0, 'total_articles': 0, 'avg_articles': 0.0}
+    
+    def get_recent_runs(self, days: int = 3, data_type: str = "articles") -> List[Dict[str, Any]]:
         """Get recent run metrics from the last N days."""
         try:
             # This would need a proper database query implementation
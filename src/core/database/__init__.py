@@ -13,7 +13,7 @@ from .metrics_service import MetricsService
 from .database_facade import DatabaseFacade
 
 # Re-export items from the new adapter system
-from ..adapters.connection import get_database
+from ..adapters.connection import get_database, get_database_async
 from ..adapters.legacy_adapter import DatabaseAdapter
 
 __all__ = [
@@ -25,5 +25,6 @@ __all__ = [
     'MetricsService',
     'DatabaseFacade',
     'get_database',
+    'get_database_async',
     'DatabaseAdapter'
 ]
\ No newline at end of file
@@ -7,6 +7,7 @@ connection pooling, and error recovery.
 """
 
 import logging
+import time
 import psycopg
 from psycopg.rows import dict_row
 from typing import Optional, Dict, Any
@@ -14,6 +15,10 @@ from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# A connection idle for longer than this is probed before reuse, since the
+# server or the pooler in front of it may have dropped it in the meantime
+_IDLE_CHECK_SECONDS = 60
+
 
 class DatabaseError(Exception):
     """Custom exception for database operations."""
@@ -32,6 +37,7 @@ class ConnectionManager:
         """
         self.config = config
         self.connection: Optional[psycopg.Connection] = None
+        self._last_used = 0.0
         self._connect()
     
     def _build_connection_string(self) -> str:
@@ -59,23 +65,32 @@ class ConnectionManager:
                 autocommit=True,
                 connect_timeout=self.config.connection_timeout
             )
+            self._last_used = time.monotonic()
             logger.debug("Database connection established")
             
         except psycopg.Error as e:
             raise DatabaseError(f"Failed to connect to database: {e}")
     
     def ensure_connection(self) -> None:
-        """Ensure database connection is active, reconnect if needed."""
+        """
+        Ensure database connection is active, reconnect if needed.
+        
+        A connection in recent use is reused as is; only one that has been
+        idle for a while is tested with a query first, so back-to-back
+        operations don't pay an extra round-trip each.
+        """
         try:
-            if not self.connection or self.connection.closed:
+            if not self.connection or self.connection.closed or self.connection.broken:
                 self._connect()
-            else:
+            elif time.monotonic() - self._last_used >= _IDLE_CHECK_SECONDS:
                 # Test connection with a simple query
                 with self.connection.cursor() as cursor:
                     cursor.execute("SELECT 1")
         except psycopg.Error:
             logger.warning("Connection test failed, reconnecting...")
             self._connect()
+        
+        self._last_used = time.monotonic()
     
     def get_connection(self) -> psycopg.Connection:
         """
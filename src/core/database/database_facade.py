@@ -8,7 +8,7 @@ with the original DatabaseAdapter while using the new modular services.
 
 import logging
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from .connection_manager import ConnectionManager, DatabaseError
 from .article_service import ArticleService  
@@ -69,12 +69,24 @@ class DatabaseFacade:
         """Update known items with current timestamp."""
         return self.state.update_known_items(item_hashes, item_type)
     
+    def cleanup_known_items_with_counts(self, days: int = 30) -> Tuple[int, int, int]:
+        """Remove old known items, returning (before, deleted, after) counts."""
+        return self.state.cleanup_with_counts(days)
+    
+    def reset_known_items(self) -> int:
+        """Remove all known items, returning how many were deleted."""
+        return self.state.reset_known_items()
+    
     # Metrics Operations (backward compatibility)
     
     def store_run_metrics(self, run_id: str, command: str, metrics: Dict[str, Any]):
         """Store run metrics in database."""
         return self.metrics.store_run_metrics(run_id, command, metrics)
     
+    def get_run_aggregates(self, days: int = 7) -> Dict[str, Any]:
+        """Get run count and article totals for the last N days."""
+        return self.metrics.get_run_aggregates(days)
+    
     # Cleanup Operations (backward compatibility)
     
     def cleanup_old_records(self) -> int:
@@ -108,13 +120,22 @@ class DatabaseFacade:
     
     # Health Check (backward compatibility)
     
-    def health_check(self) -> Dict[str, Any]:
-        """Check database connection and return comprehensive status info."""
+    def health_check(self, full: bool = True) -> Dict[str, Any]:
+        """
+        Check database connection and return status info.
+        
+        Args:
+            full: Also collect per-table statistics; when False only the
+                connection itself is probed
+            
+        Returns:
+            Health status information
+        """
         try:
             # Get basic connection health
             health_info = self.connection_manager.health_check()
             
-            if not health_info.get('connected', False):
+            if not full or not health_info.get('connected', False):
                 return health_info
             
             # Get table row counts and additional stats
@@ -9,6 +9,8 @@ import logging
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any, Optional
 
+from .connection_manager import DatabaseError
+
 logger = logging.getLogger(__name__)
 
 
@@ -92,6 +94,38 @@ class MetricsService:
             logger.error(f"Failed to get recent runs: {e}")
             raise
     
+    def get_run_aggregates(self, days: int = 7) -> Dict[str, Any]:
+        """
+        Get run totals computed in the database.
+        
+        Args:
+            days: Number of days to look back
+            
+        Returns:
+            Dictionary with total_runs, total_articles and avg_articles
+        """
+        try:
+            with self.connection_manager.get_cursor() as cursor:
+                cursor.execute("""
+                    SELECT 
+                        COUNT(*) as total_runs,
+                        COALESCE(SUM(articles_after_dedup), 0) as total_articles,
+                        COALESCE(AVG(articles_after_dedup), 0) as avg_articles
+                    FROM run_metrics
+                    WHERE timestamp >= %s
+                """, (datetime.now(timezone.utc) - timedelta(days=days),))
+                
+                row = cursor.fetchone()
+                return {
+                    'total_runs': row['total_runs'],
+                    'total_articles': int(row['total_articles']),
+                    'avg_articles': float(row['avg_articles'])
+                }
+                
+        except Exception as e:
+            logger.error(f"Failed to get run aggregates: {e}")
+            raise DatabaseError(f"Failed to get run aggregates: {e}") from e
+    
     def get_run_metrics_by_id(self, run_id: str) -> Optional[Dict[str, Any]]:
         """
         Get run metrics by run ID.
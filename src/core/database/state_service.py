@@ -7,7 +7,7 @@ Handles all database operations related to known items and state management.
 
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -168,6 +168,43 @@ class StateService:
             logger.error(f"Failed to cleanup old known items: {e}")
             raise
     
+    def cleanup_with_counts(self, days: int = 30) -> Tuple[int, int, int]:
+        """
+        Remove known items older than specified days and count around it.
+        
+        The counts and the delete run as a single statement, so they come
+        from one round-trip and describe the same snapshot of the table.
+        
+        Args:
+            days: Age threshold in days
+            
+        Returns:
+            Tuple of (items before, items deleted, items after)
+        """
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+        
+        try:
+            with self.connection_manager.get_cursor() as cursor:
+                cursor.execute("""
+                    WITH deleted AS (
+                        DELETE FROM known_items
+                        WHERE last_seen < %s
+                        RETURNING id
+                    )
+                    SELECT
+                        (SELECT COUNT(*) FROM known_items) AS before_count,
+                        (SELECT COUNT(*) FROM deleted) AS deleted_count
+                """, (cutoff_date,))
+                
+                row = cursor.fetchone()
+                before_count, deleted_count = row['before_count'], row['deleted_count']
+                logger.info(f"Deleted {deleted_count} known items older than {days} days")
+                return before_count, deleted_count, before_count - deleted_count
+                
+        except Exception as e:
+            logger.error(f"Failed to cleanup old known items: {e}")
+            raise
+    
     def get_state_stats(self) -> Dict[str, Any]:
         """
         Get state management statistics.
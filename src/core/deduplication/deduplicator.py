@@ -101,7 +101,8 @@ class StrategyBasedDeduplicator:
                 reverse=True  # Newest first
             )
         else:
-            sorted_articles = articles[:]
+            # Only iterated, so the caller's list needs no copy
+            sorted_articles = articles
         
         unique_articles = []
         processed_count = 0
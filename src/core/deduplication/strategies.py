@@ -6,10 +6,11 @@ Provides different strategies for detecting duplicate articles using the Strateg
 Each strategy focuses on a specific aspect of duplicate detection.
 """
 
+import hashlib
 import re
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Set, Optional, Tuple
+from typing import Dict, List, Set, Optional, Tuple
 from difflib import SequenceMatcher
 import unicodedata
 from urllib.parse import urlparse
@@ -19,6 +20,30 @@ from core.feed_parser import Article
 logger = logging.getLogger(__name__)
 
 
+def _matcher_for(matchers: Dict[str, SequenceMatcher], a: str, b: str) -> SequenceMatcher:
+    """
+    Get a SequenceMatcher comparing ``a`` against ``b``.
+    
+    SequenceMatcher caches its analysis of the second sequence, and each
+    kept article is the second sequence of many comparisons, so one matcher
+    per ``b`` is reused and only ``a`` is swapped in.
+    
+    Args:
+        matchers: Matchers by second sequence, filled in as needed
+        a: First sequence
+        b: Second sequence
+        
+    Returns:
+        Matcher set up for ``a`` and ``b``
+    """
+    matcher = matchers.get(b)
+    if matcher is None:
+        matcher = matchers[b] = SequenceMatcher(None, a, b)
+    else:
+        matcher.set_seq1(a)
+    return matcher
+
+
 class DeduplicationStrategy(ABC):
     """Abstract base class for deduplication strategies."""
     
@@ -61,12 +86,21 @@ class ExactUrlStrategy(DeduplicationStrategy):
             'utm_source', 'utm_medium', 'utm_campaign', 'utm_content', 'utm_term',
             'fbclid', 'gclid', 'ref', 'source'
         }
+        # Articles are compared pairwise, so each URL is normalized once
+        self._normalized = {}
     
     def normalize_url(self, url: str) -> str:
         """Normalize URL by removing tracking parameters and fragments."""
         if not url:
             return ""
-            
+        
+        normalized = self._normalized.get(url)
+        if normalized is None:
+            normalized = self._normalized[url] = self._normalize_url(url)
+        return normalized
+    
+    def _normalize_url(self, url: str) -> str:
+        """Normalize a URL without consulting the cache."""
         # Remove fragment
         url = url.split('#')[0]
         
@@ -120,6 +154,15 @@ class SimilarUrlStrategy(DeduplicationStrategy):
         """
         self.path_similarity_threshold = path_similarity_threshold
         self.exact_url_strategy = ExactUrlStrategy()
+        self._parsed = {}
+        self._matchers = {}
+    
+    def _parse(self, url: str):
+        """Parse a normalized URL, once per distinct URL."""
+        parsed = self._parsed.get(url)
+        if parsed is None:
+            parsed = self._parsed[url] = urlparse(url)
+        return parsed
     
     def is_duplicate(self, article1: Article, article2: Article) -> bool:
         """Check if articles have similar URLs (same domain, similar path)."""
@@ -134,16 +177,20 @@ class SimilarUrlStrategy(DeduplicationStrategy):
             if not url1 or not url2:
                 return False
             
-            parsed1 = urlparse(url1)
-            parsed2 = urlparse(url2)
+            parsed1 = self._parse(url1)
+            parsed2 = self._parse(url2)
             
             # Must be same domain
             if parsed1.netloc != parsed2.netloc:
                 return False
                 
-            # Check path similarity
-            path_similarity = SequenceMatcher(None, parsed1.path, parsed2.path).ratio()
-            return path_similarity >= self.path_similarity_threshold
+            # Check path similarity; the quick ratios are upper bounds of
+            # ratio(), so most dissimilar paths are rejected without it
+            threshold = self.path_similarity_threshold
+            matcher = _matcher_for(self._matchers, parsed1.path, parsed2.path)
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                return False
+            return matcher.ratio() >= threshold
             
         except Exception as e:
             logger.debug(f"Error in similar URL comparison: {e}")
@@ -180,12 +227,24 @@ class TitleSimilarityStrategy(DeduplicationStrategy):
             'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before', 'after',
             'above', 'below', 'between', 'among', 'this', 'that', 'these', 'those'
         }
+        
+        # Articles are compared pairwise, so each title is processed once
+        self._normalized = {}
+        self._keywords = {}
+        self._matchers = {}
     
     def normalize_text(self, text: str) -> str:
         """Normalize text for comparison."""
         if not text:
             return ""
-            
+        
+        normalized = self._normalized.get(text)
+        if normalized is None:
+            normalized = self._normalized[text] = self._normalize_text(text)
+        return normalized
+    
+    def _normalize_text(self, text: str) -> str:
+        """Normalize text without consulting the cache."""
         # Normalize Unicode characters (helpful for Hebrew)
         text = unicodedata.normalize('NFKD', text)
         
@@ -202,14 +261,28 @@ class TitleSimilarityStrategy(DeduplicationStrategy):
     
     def extract_keywords(self, title: str) -> Set[str]:
         """Extract meaningful keywords from title."""
-        normalized = self.normalize_text(title)
-        words = set(normalized.split())
-        
-        # Remove stop words and short words
-        keywords = {word for word in words - self.stop_words if len(word) > 2}
+        keywords = self._keywords.get(title)
+        if keywords is None:
+            words = set(self.normalize_text(title).split())
+            
+            # Remove stop words and short words
+            keywords = self._keywords[title] = frozenset(
+                word for word in words - self.stop_words if len(word) > 2
+            )
         
         return keywords
     
+    def _keyword_similarity(self, title1: str, title2: str) -> float:
+        """Jaccard similarity of the two titles' keyword sets."""
+        keywords1 = self.extract_keywords(title1)
+        keywords2 = self.extract_keywords(title2)
+        
+        if not keywords1 or not keywords2:
+            return 0.0
+        
+        union = len(keywords1 | keywords2)
+        return len(keywords1 & keywords2) / union if union else 0.0
+    
     def calculate_similarity(self, title1: str, title2: str) -> float:
         """Calculate similarity between two titles."""
         if not title1 or not title2:
@@ -225,15 +298,7 @@ class TitleSimilarityStrategy(DeduplicationStrategy):
         text_similarity = SequenceMatcher(None, norm1, norm2).ratio()
         
         # Method 2: Keyword overlap similarity  
-        keywords1 = self.extract_keywords(title1)
-        keywords2 = self.extract_keywords(title2)
-        
-        if not keywords1 or not keywords2:
-            keyword_similarity = 0.0
-        else:
-            intersection = keywords1.intersection(keywords2)
-            union = keywords1.union(keywords2)
-            keyword_similarity = len(intersection) / len(union) if union else 0.0
+        keyword_similarity = self._keyword_similarity(title1, title2)
         
         # Combine methods (weighted average)
         combined_similarity = (text_similarity * 0.6) + (keyword_similarity * 0.4)
@@ -242,8 +307,26 @@ class TitleSimilarityStrategy(DeduplicationStrategy):
     
     def is_duplicate(self, article1: Article, article2: Article) -> bool:
         """Check if articles have similar titles."""
-        similarity = self.calculate_similarity(article1.title, article2.title)
-        return similarity >= self.similarity_threshold
+        threshold = self.similarity_threshold
+        title1, title2 = article1.title, article2.title
+        if not title1 or not title2:
+            return threshold <= 0.0
+        
+        norm1 = self.normalize_text(title1)
+        norm2 = self.normalize_text(title2)
+        if norm1 == norm2:
+            return threshold <= 1.0
+        
+        # Same score as calculate_similarity(). The quick ratios are upper
+        # bounds of ratio(), so only pairs that could still reach the
+        # threshold pay for the full comparison
+        keyword_part = self._keyword_similarity(title1, title2) * 0.4
+        matcher = _matcher_for(self._matchers, norm1, norm2)
+        if (matcher.real_quick_ratio() * 0.6) + keyword_part < threshold:
+            return False
+        if (matcher.quick_ratio() * 0.6) + keyword_part < threshold:
+            return False
+        return (matcher.ratio() * 0.6) + keyword_part >= threshold
     
     def get_priority(self) -> int:
         """Lower priority than URL-based strategies."""
@@ -280,11 +363,17 @@ class ExactTitleStrategy(DeduplicationStrategy):
 class ContentHashStrategy(DeduplicationStrategy):
     """Strategy for detecting duplicates using content hash (title + link + source)."""
     
+    def __init__(self):
+        """Initialize content hash strategy."""
+        self._hashes = {}
+    
     def generate_content_hash(self, article: Article) -> str:
         """Generate content hash for article."""
-        import hashlib
         content = f"{article.title}|{article.link}|{article.source}"
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+        content_hash = self._hashes.get(content)
+        if content_hash is None:
+            content_hash = self._hashes[content] = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return content_hash
     
     def is_duplicate(self, article1: Article, article2: Article) -> bool:
         """Check if articles have identical content hashes."""
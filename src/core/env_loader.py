@@ -3,6 +3,11 @@
 Environment variable loader with .env file support.
 
 Safely loads environment variables from .env file if present.
+
+Nothing is loaded at import time: call ``load_env()`` where the environment
+is needed. Lookups through ``get_env_var`` load it on the first miss, so
+runs whose environment is already populated (e.g. GitHub Actions) never
+read ``.env``.
 """
 
 import os
@@ -11,6 +16,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Set once .env has been processed, so child processes skip it too
+_LOADED_FLAG = 'NEWSER_ENV_LOADED'
+
 def load_env_file(env_file_path: str = ".env") -> None:
     """
     Load environment variables from .env file if it exists.
@@ -67,6 +75,19 @@ def load_env_file(env_file_path: str = ".env") -> None:
     except Exception as e:
         logger.error(f"Error loading .env file {env_path}: {e}")
 
+def load_env(env_file_path: str = ".env") -> None:
+    """
+    Load the .env file at most once per environment.
+    
+    Args:
+        env_file_path: Path to .env file (default: ".env" in project root)
+    """
+    if os.environ.get(_LOADED_FLAG):
+        return
+    
+    load_env_file(env_file_path)
+    os.environ[_LOADED_FLAG] = '1'
+
 def get_env_var(key: str, default: str = None, required: bool = False) -> str:
     """
     Get environment variable with optional default and required validation.
@@ -82,6 +103,9 @@ def get_env_var(key: str, default: str = None, required: bool = False) -> str:
     Raises:
         ValueError: If required variable is missing
     """
+    if key not in os.environ:
+        load_env()
+    
     value = os.environ.get(key, default)
     
     if required and not value:
@@ -104,6 +128,9 @@ def validate_database_config() -> bool:
         'SUPABASE_DB_PASSWORD'
     ]
     
+    if not all(os.environ.get(var) for var in required_vars):
+        load_env()
+    
     missing = []
     for var in required_vars:
         if not os.environ.get(var):
@@ -132,6 +159,3 @@ def get_database_config() -> dict:
         'supabase_password': get_env_var('SUPABASE_DB_PASSWORD', required=True),
         'supabase_anon_key': get_env_var('SUPABASE_ANON_KEY')  # Optional for direct DB access
     }
-
-# Auto-load .env file when module is imported
-load_env_file()
\ No newline at end of file
@@ -228,6 +228,15 @@ class ValidationError(NewsAggregatorError):
         super().__init__(message, context=context)
 
 
+# CLI-related exceptions
+class CLIError(NewsAggregatorError):
+    """Expected command-line usage error (unknown command, bad subcommand)."""
+    
+    def __init__(self, message: str, command: Optional[str] = None):
+        context = {'command': command} if command else None
+        super().__init__(message, context=context)
+
+
 # Recovery utilities
 class ErrorRecovery:
     """Utilities for error recovery and retry logic."""
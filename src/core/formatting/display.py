@@ -13,11 +13,7 @@ from ..models.analysis import HebrewAnalysisResult
 
 def format_article(article: Article) -> str:
     """Format a single article for display."""
-    timestamp = ""
-    if article.published:
-        timestamp = article.published.strftime("%Y-%m-%d %H:%M")
-    
-    return f"[{timestamp}] [{article.source.upper()}] {article.title}\n    {article.link}\n"
+    return f"[{article.published_label}] [{article.source_label}] {article.title}\n    {article.link}\n"
 
 
 def articles_to_dict(articles: List[Article]) -> List[dict]:
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache
+
+Persists structured LLM responses on disk so that repeating an identical
+request - for example ``news fetch`` followed shortly by ``news analyze``
+over the same articles - reuses the earlier answer instead of paying for
+the tokens again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Responses older than this are ignored and eventually overwritten
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+_CACHE_FILE = Path('newser') / 'llm_responses.sqlite'
+
+
+def _default_cache_path() -> Path:
+    """Get the on-disk location of the response cache."""
+    cache_root = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_root) / _CACHE_FILE
+
+
+class LLMResponseCache:
+    """SQLite-backed cache of LLM responses keyed by a hash of the request."""
+
+    def __init__(self, path: Optional[Path] = None, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """
+        Initialize the response cache.
+        
+        Args:
+            path: Database file (defaults to the user cache directory)
+            ttl_seconds: How long a stored response stays valid
+        """
+        self.path = Path(path) if path is not None else _default_cache_path()
+        self.ttl_seconds = ttl_seconds
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a request.
+        
+        Message contents are stripped and the request is serialized with
+        sorted keys, so formatting differences don't cause misses.
+        
+        Args:
+            request: Model, messages and generation parameters
+        
+        Returns:
+            Hex SHA-256 digest of the canonical request
+        """
+        canonical = dict(request)
+        if 'messages' in canonical:
+            canonical['messages'] = [
+                {**message, 'content': (message.get('content') or '').strip()}
+                for message in canonical['messages']
+            ]
+        payload = json.dumps(canonical, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the database on first use, creating it if needed.
+        
+        Responses past the TTL are deleted on open, so the file only holds
+        entries that can still be served.
+        """
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path)
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+                )
+                connection.execute(
+                    "DELETE FROM responses WHERE created_at < ?",
+                    (time.time() - self.ttl_seconds,)
+                )
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str, ttl_seconds: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a stored response if it is still fresh.
+        
+        Args:
+            key: Cache key from ``make_key``
+            ttl_seconds: Maximum age for this lookup (defaults to the cache TTL)
+        
+        Returns:
+            The stored response, or None on a miss or cache error
+        """
+        try:
+            row = self._connect().execute(
+                "SELECT response FROM responses WHERE key = ? AND created_at >= ?",
+                (key, time.time() - (self.ttl_seconds if ttl_seconds is None else ttl_seconds))
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM response cache lookup failed: {e}")
+            return None
+        
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, response: Dict[str, Any]) -> None:
+        """
+        Store a response.
+        
+        Args:
+            key: Cache key from ``make_key``
+            response: JSON-serializable response
+        """
+        try:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(response, ensure_ascii=False), time.time())
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"LLM response cache write failed: {e}")
+
+
+# Global cache instance
+_llm_response_cache = None
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """Get the global LLM response cache instance."""
+    global _llm_response_cache
+    if _llm_response_cache is None:
+        _llm_response_cache = LLMResponseCache()
+    return _llm_response_cache
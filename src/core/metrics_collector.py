@@ -115,7 +115,9 @@ class MetricsCollector:
         self._current_run_id: Optional[str] = None
         self._current_command: Optional[str] = None
         self._run_start_time: Optional[float] = None
+        self._run_start_dt: Optional[datetime] = None
         self._current_operations: List[TimingMetrics] = []
+        self._op_totals: Dict[str, float] = {}
         self._run_stats: Dict[str, Any] = {}
         
         logger.debug("MetricsCollector initialized")
@@ -125,7 +127,9 @@ class MetricsCollector:
         self._current_run_id = run_id
         self._current_command = command
         self._run_start_time = time.time()
+        self._run_start_dt = datetime.fromtimestamp(self._run_start_time)
         self._current_operations = []
+        self._op_totals = {}
         self._run_stats = {
             "articles_scraped": 0,
             "articles_after_dedup": 0,
@@ -164,7 +168,9 @@ class MetricsCollector:
         self._current_run_id = None
         self._current_command = None
         self._run_start_time = None
+        self._run_start_dt = None
         self._current_operations = []
+        self._op_totals = {}
         self._run_stats = {}
         
         logger.info(f"Completed run {run_metrics.run_id} in {total_duration:.2f}s")
@@ -197,8 +203,14 @@ class MetricsCollector:
             )
             
             self._current_operations.append(timing)
+            self._op_totals[operation_name] = self._op_totals.get(operation_name, 0.0) + duration
             logger.debug(f"Operation '{operation_name}' took {duration:.2f}s (success: {success})")
     
+    @property
+    def articles_scraped(self) -> int:
+        """Articles scraped in the current run (0 before any are recorded)."""
+        return self._run_stats.get("articles_scraped", 0)
+    
     def record_stat(self, key: str, value: Any) -> None:
         """Record a statistic for the current run."""
         self._run_stats[key] = value
@@ -7,7 +7,7 @@ Contains data structures for AI analysis results and metrics.
 
 from datetime import datetime
 from typing import List, Dict, Any
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 
 
 @dataclass
@@ -37,6 +37,17 @@ class HebrewAnalysisResult:
         self.confidence = max(0.0, min(1.0, self.confidence))
         self.summary = self.summary.strip()
         self.bulletins = self.bulletins.strip()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        data = asdict(self)
+        data['analysis_timestamp'] = self.analysis_timestamp.isoformat()
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'HebrewAnalysisResult':
+        """Create a result from a dictionary produced by ``to_dict``."""
+        return cls(**{**data, 'analysis_timestamp': datetime.fromisoformat(data['analysis_timestamp'])})
 
 
 @dataclass
@@ -6,6 +6,7 @@ Represents a news article with metadata and analysis fields.
 """
 
 from datetime import datetime
+from functools import cached_property
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
@@ -63,6 +64,16 @@ class Article:
         # Ensure confidence is in valid range
         self.confidence = max(0.0, min(1.0, self.confidence))
     
+    @cached_property
+    def source_label(self) -> str:
+        """Source name as shown in article listings."""
+        return self.source.upper()
+    
+    @cached_property
+    def published_label(self) -> str:
+        """Publication time as shown in article listings, or empty if unknown."""
+        return self.published.strftime("%Y-%m-%d %H:%M") if self.published else ""
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API integration and JSON serialization."""
         return {
@@ -11,7 +11,7 @@ and incremental updates with better performance and reliability.
 import hashlib
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
 from core.database import get_database, DatabaseAdapter, DatabaseError
@@ -84,15 +84,34 @@ class StateManager:
             logger.error(f"Failed to cleanup old items: {e}")
             return 0
     
-    def reset_state(self) -> None:
-        """Reset known items (removes all from database)."""
-        try:
-            # This would require a specific database operation
-            # For now, just log the intention
-            logger.warning("Reset state called - this would clear all known items from database")
-            logger.warning("Manual database truncation required for known_items table")
-        except Exception as e:
-            logger.error(f"Failed to reset state: {e}")
+    def cleanup_with_counts(self, days: int = 30) -> Tuple[int, int, int]:
+        """
+        Remove known items not seen for the given number of days.
+        
+        Unlike the other state helpers this does not swallow database
+        errors, so callers can tell a failed cleanup from an empty one.
+        
+        Args:
+            days: Age threshold in days
+            
+        Returns:
+            Tuple of (items before, items removed, items after)
+        """
+        return self.db.cleanup_known_items_with_counts(days)
+    
+    def reset_state(self) -> int:
+        """
+        Reset known items (removes all from database).
+        
+        Database errors propagate, so a failed reset is never reported as
+        an empty one.
+        
+        Returns:
+            Number of items removed
+        """
+        removed_count = self.db.reset_known_items()
+        logger.warning(f"Reset state: removed {removed_count} known items")
+        return removed_count
     
     def get_stats(self) -> Dict[str, Any]:
         """Get state statistics for monitoring."""
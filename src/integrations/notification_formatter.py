@@ -51,7 +51,6 @@ class NotificationFormatter:
             return "📰 אין חדשות חדשות"
         
         count = len(articles)
-        time_str = datetime.now().strftime("%H:%M")
         
         if style == "headlines":
             # Direct headlines approach - maximize space for headlines
@@ -100,9 +99,6 @@ class NotificationFormatter:
                 "username": "NewsBot",
             }
         
-        count = len(articles)
-        time_str = datetime.now().strftime("%H:%M")
-        
         # Create headlines list with source icons instead of numbers
         headlines = []
         for article in articles:
@@ -227,7 +223,6 @@ class NotificationFormatter:
             return self.format_slack_headlines_first(articles, hebrew_result)
         
         count = len(articles)
-        time_str = datetime.now().strftime("%H:%M")
         
         # Main topic
         main_topic = "עדכונים"
@@ -273,7 +268,6 @@ class NotificationFormatter:
             return self.format_slack_compact(articles, hebrew_result)
         
         count = len(articles)
-        time_str = datetime.now().strftime("%d/%m %H:%M")
         
         # Header with key metrics
         confidence_bar = ""
@@ -361,7 +355,6 @@ class NotificationFormatter:
         
         # Main message
         count = len(articles)
-        time_str = datetime.now().strftime("%H:%M")
         
         main_topics = ""
         if hebrew_result and hebrew_result.key_topics:
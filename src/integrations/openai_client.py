@@ -51,6 +51,9 @@ class OpenAIClient:
         self.max_tokens = 2500
         self.temperature = 0.3  # Lower temperature for more consistent analysis
         
+        # Optional LLMResponseCache consulted by structured requests
+        self.response_cache = None
+        
     def _make_structured_request(self, messages: List[Dict[str, str]], schema: Dict[str, Any], analysis_type: str = "unknown") -> Dict[str, Any]:
         """Make a structured request to OpenAI API with JSON schema enforcement."""
         
@@ -70,6 +73,21 @@ class OpenAIClient:
             logger.info(f"Message {i+1} [{role.upper()}]:\n{content_preview}")
         logger.info("=== END LLM INPUT ===")
         
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache.make_key({
+                'model': self.model,
+                'messages': messages,
+                'max_tokens': self.max_tokens,
+                'temperature': self.temperature,
+                'schema': schema,
+                'analysis_type': analysis_type,
+            })
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached OpenAI response for {analysis_type}")
+                return cached
+        
         try:
             # Use structured outputs with JSON schema
             response = self.client.chat.completions.create(
@@ -150,6 +168,9 @@ class OpenAIClient:
             except Exception as e:
                 logger.error(f"Failed to log LLM interaction to debug file: {e}")
             
+            if cache_key is not None:
+                self.response_cache.set(cache_key, result)
+            
             return result
             
         except Exception as e:
@@ -20,6 +20,26 @@ logger = logging.getLogger(__name__)
 class PushNotifier:
     """Handles push notifications via various providers."""
     
+    # Environment variables each provider needs before it can send
+    _PROVIDER_ENV_VARS = {
+        "onesignal": ('ONESIGNAL_APP_ID', 'ONESIGNAL_API_KEY'),
+        "firebase": ('FIREBASE_SERVER_KEY',),
+    }
+    
+    @classmethod
+    def is_provider_configured(cls, provider: str) -> bool:
+        """
+        Check a provider's credentials without constructing a notifier.
+        
+        Args:
+            provider: Push service provider ('onesignal', 'firebase', 'apns')
+            
+        Returns:
+            True if every credential the provider needs is set
+        """
+        env_vars = cls._PROVIDER_ENV_VARS.get(provider.lower())
+        return bool(env_vars) and all(os.getenv(name) for name in env_vars)
+    
     def __init__(self, provider: str = "onesignal"):
         """
         Initialize push notifier.
@@ -206,8 +226,4 @@ class PushNotifier:
     
     def _is_configured(self) -> bool:
         """Check if push service is properly configured."""
-        if self.provider == "onesignal":
-            return bool(self.app_id and self.api_key)
-        elif self.provider == "firebase":
-            return bool(self.server_key)
-        return False
+        return self.is_provider_configured(self.provider)
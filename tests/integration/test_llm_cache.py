@@ -0,0 +1,76 @@
+import sqlite3
+import time
+
+import pytest
+
+from core.llm_cache import LLMResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMResponseCache(path=tmp_path / "llm_responses.sqlite", ttl_seconds=60)
+    yield cache
+    if cache._connection is not None:
+        cache._connection.close()
+
+
+def _request(content):
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [{"role": "user", "content": content}],
+        "temperature": 0.3,
+    }
+
+
+def test_make_key_ignores_whitespace_and_key_order():
+    """Test requests that differ only in formatting share a key."""
+    request = _request("What happened today?")
+    reordered = {"temperature": 0.3, "messages": [{"content": "  What happened today?\n", "role": "user"}],
+                 "model": "gpt-4o-mini"}
+    
+    assert LLMResponseCache.make_key(request) == LLMResponseCache.make_key(reordered)
+    assert LLMResponseCache.make_key(request) != LLMResponseCache.make_key(_request("Something else"))
+
+
+def test_get_returns_stored_response(cache):
+    """Test a stored response is returned and a missing key is a miss."""
+    key = LLMResponseCache.make_key(_request("headlines"))
+    cache.set(key, {"summary": "כותרות", "confidence": 0.9})
+    
+    assert cache.get(key) == {"summary": "כותרות", "confidence": 0.9}
+    assert cache.get(LLMResponseCache.make_key(_request("other"))) is None
+
+
+def test_get_ignores_expired_response(cache):
+    """Test responses older than the TTL, or a per-lookup TTL, are misses."""
+    key = LLMResponseCache.make_key(_request("headlines"))
+    cache.set(key, {"summary": "old"})
+    with cache._connection:
+        cache._connection.execute("UPDATE responses SET created_at = ?", (time.time() - 30,))
+    
+    assert cache.get(key) == {"summary": "old"}
+    assert cache.get(key, ttl_seconds=10) is None
+    
+    with cache._connection:
+        cache._connection.execute("UPDATE responses SET created_at = ?", (time.time() - 120,))
+    
+    assert cache.get(key) is None
+
+
+def test_expired_rows_are_deleted_on_open(cache):
+    """Test opening the cache prunes responses past the TTL."""
+    cache.set("fresh", {"n": 1})
+    cache.set("stale", {"n": 2})
+    with cache._connection:
+        cache._connection.execute(
+            "UPDATE responses SET created_at = ? WHERE key = 'stale'", (time.time() - 120,)
+        )
+    cache._connection.close()
+    
+    reopened = LLMResponseCache(path=cache.path, ttl_seconds=60)
+    assert reopened.get("fresh") == {"n": 1}
+    reopened._connection.close()
+    
+    with sqlite3.connect(cache.path) as connection:
+        keys = [row[0] for row in connection.execute("SELECT key FROM responses")]
+    assert keys == ["fresh"]
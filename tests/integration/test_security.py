@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+
+import pytest
+
+from core.security import SecurityValidator
+
+
+@pytest.fixture
+def validator():
+    return SecurityValidator()
+
+
+@pytest.mark.parametrize("texts", [
+    [],
+    ["", None, "plain"],
+    ["<b>bold</b> &amp; more", "a < b", "c > d"],
+    ["<script>alert(1)", "</script> after", "onclick = x"],
+    ["  spaced\n\ttext  ", "&lt;i&gt;escaped&lt;/i&gt;", "javascript:void(0)"],
+    ["x" * 600, "כותרת בעברית"],
+])
+def test_sanitize_texts_matches_sanitize_text(validator, texts):
+    """Test batch sanitization gives the same result as one text at a time."""
+    expected = [validator.sanitize_text(text, validator.MAX_TITLE_LENGTH) for text in texts]
+    
+    assert validator.sanitize_texts(texts, validator.MAX_TITLE_LENGTH) == expected
+
+
+def test_sanitize_texts_with_separator_in_input(validator):
+    """Test texts containing the batch separator are still cleaned individually."""
+    texts = ["a\x00<b>b</b>", "<i>c</i>"]
+    
+    assert validator.sanitize_texts(texts) == [validator.sanitize_text(text) for text in texts]
+
+
+def test_validate_and_sanitize_batch(validator):
+    """Test untrusted URLs are masked out and only passing articles are sanitized."""
+    articles = [
+        SimpleNamespace(link="https://www.ynet.co.il/a", title="<b>One</b>", summary=None),
+        SimpleNamespace(link="https://evil.example.com/b", title="Two", summary="x"),
+        SimpleNamespace(link="https://www.haaretz.co.il/c", title="Three", summary="<p>Body</p>"),
+    ]
+    
+    mask, titles, summaries = validator.validate_and_sanitize_batch(articles)
+    
+    assert mask == [True, False, True]
+    assert titles == ["One", "Three"]
+    assert summaries == ["", "Body"]